@@ -30,8 +30,8 @@ print("=" * 80)
 catalog_name = Config.CATALOG_NAME
 
 # Get all Spark configurations related to the catalog
-all_conf = spark.sparkContext.getConf().getAll()
-catalog_configs = [(k, v) for k, v in all_conf if catalog_name in k]
+conf_map = dict(spark.sparkContext.getConf().getAll())
+catalog_configs = [(k, v) for k, v in conf_map.items() if catalog_name in k]
 
 for key, value in sorted(catalog_configs):
     print(f"{key} = {value}")
@@ -41,7 +41,7 @@ print("=" * 80)
 print("Checking for 'type' property...")
 print("=" * 80)
 type_key = f"spark.sql.catalog.{catalog_name}.type"
-type_value = dict(all_conf).get(type_key, "NOT SET")
+type_value = conf_map.get(type_key, "NOT SET")
 print(f"{type_key} = {type_value}")
 
 if type_value == "glue":
@@ -7,13 +7,13 @@ to a backup location with abstracted paths.
 """
 
 import argparse
-import json
 import os
-import re
-import shutil
 import sys
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from bcn import json_utils
 from bcn.config import Config
 from bcn.iceberg_utils import ManifestFileHandler, PathAbstractor
 from bcn.logging_config import BCNLogger
@@ -26,7 +26,16 @@ logger = BCNLogger.get_logger(__name__)
 class IcebergBackup:
     """Orchestrates the backup process for an Iceberg table"""
 
-    def __init__(self, database: str, table: str, backup_name: str, catalog: str = None):
+    def __init__(
+        self,
+        database: str,
+        table: str,
+        backup_name: str,
+        catalog: str = None,
+        current_only: bool = False,
+        min_snapshot_timestamp_ms: Optional[int] = None,
+        spark_client: Optional[SparkClient] = None,
+    ):
         """
         Initialize backup process
 
@@ -35,6 +44,11 @@ class IcebergBackup:
             table: Table name
             backup_name: Name for this backup
             catalog: Catalog name (optional). Uses fallback: parameter -> env var -> default
+            current_only: Only back up the current snapshot (no time travel after restore)
+            min_snapshot_timestamp_ms: Skip ancestor snapshots committed before this
+                                       timestamp (the current snapshot is always kept)
+            spark_client: Spark client to use (optional). Defaults to the shared client
+                          for the catalog
 
         Raises:
             ValueError: If database, table, or backup_name are empty or contain invalid characters
@@ -48,14 +62,13 @@ class IcebergBackup:
             raise ValueError("Backup name cannot be empty")
 
         # Check for invalid characters in backup_name
-        if not re.match(r'^[a-zA-Z0-9_-]+$', backup_name):
-            raise ValueError(
-                "Backup name must contain only letters, numbers, hyphens, and underscores"
-            )
+        Config.validate_backup_name(backup_name)
 
         self.database = database.strip()
         self.table = table.strip()
         self.backup_name = backup_name.strip()
+        self.current_only = current_only
+        self.min_snapshot_timestamp_ms = min_snapshot_timestamp_ms
 
         # Catalog resolution: parameter -> environment variable -> default
         if catalog:
@@ -64,8 +77,8 @@ class IcebergBackup:
             self.catalog = os.getenv("CATALOG_NAME", Config.CATALOG_NAME)
 
         self.s3_client = S3Client()
-        self.spark_client = SparkClient(app_name=f"iceberg-backup-{backup_name}", catalog=self.catalog)
-        self.work_dir = os.path.join(Config.WORK_DIR, backup_name)
+        # Reuse the process-wide Spark client unless one is injected
+        self.spark_client = spark_client or SparkClient.get_or_create(self.catalog)
 
     def create_backup(self) -> bool:
         """
@@ -98,71 +111,41 @@ class IcebergBackup:
             # Step 2: Download and parse main metadata file
             logger.info("Step 2: Downloading and parsing main metadata file...")
             bucket, key = self.s3_client.parse_s3_uri(metadata_location)
-            metadata_content = self.s3_client.read_object(bucket, key)
+            metadata_content = self.s3_client.read_large_object(bucket, key)
             if not metadata_content:
                 logger.error(f"Could not read metadata file from {metadata_location}")
                 return False
 
-            metadata = json.loads(metadata_content.decode("utf-8"))
+            metadata = json_utils.loads(metadata_content)
             logger.debug(f"Current snapshot ID: {metadata.get('current-snapshot-id')}")
 
             # Step 3: Abstract paths in metadata
             logger.info("Step 3: Abstracting paths in metadata...")
             abstracted_metadata = PathAbstractor.abstract_metadata_file(metadata, table_location)
+            # Only the abstracted copy is needed from here on; release the raw document
+            # so large metadata files are not held in memory twice
+            del metadata, metadata_content
+            self._apply_snapshot_retention(abstracted_metadata)
 
             # Step 4: Process snapshots and manifests
             logger.info("Step 4: Processing snapshots and manifest files...")
-            manifest_files = self._collect_manifest_files(metadata, table_location)
-            logger.debug(f"Found {len(manifest_files)} manifest files to process")
-
-            # Step 5: Download manifest list AND individual manifest files as raw Avro
-            logger.info("Step 5: Downloading manifest files...")
-            os.makedirs(self.work_dir, exist_ok=True)
-
-            manifest_list_paths = []
-            individual_manifest_paths = []
-
-            for manifest_list_path in manifest_files:
-                logger.debug(f"Downloading manifest list: {manifest_list_path}")
-                relative_path = PathAbstractor.abstract_path(manifest_list_path, table_location)
-                manifest_list_paths.append(relative_path)
-
-                # Read the manifest list to get individual manifest file paths
-                try:
-                    bucket, key = self.s3_client.parse_s3_uri(manifest_list_path)
-                    content = self.s3_client.read_object(bucket, key)
-                    if content:
-                        entries, _ = ManifestFileHandler.read_manifest_file(content)
-                        for entry in entries:
-                            manifest_path = entry.get("manifest_path")
-                            if not manifest_path:
-                                continue
-
-                            # Convert relative manifest path to full S3 URI
-                            if not manifest_path.startswith(
-                                "s3://"
-                            ) and not manifest_path.startswith("s3a://"):
-                                full_manifest_path = f"{table_location}/{manifest_path}"
-                            else:
-                                full_manifest_path = manifest_path
-
-                            # Store individual manifest path
-                            logger.debug(f"Found individual manifest: {manifest_path}")
-                            manifest_relative_path = PathAbstractor.abstract_path(
-                                full_manifest_path, table_location
-                            )
-                            if manifest_relative_path not in individual_manifest_paths:
-                                individual_manifest_paths.append(manifest_relative_path)
-                except Exception as e:
-                    logger.warning(f"Could not read manifest list {manifest_list_path}: {e}")
-
-            # Step 6: Collect data file references
-            logger.info("Step 6: Collecting data file references...")
-            data_files = self._collect_data_files(manifest_files, table_location)
-            logger.debug(f"Found {len(data_files)} data files")
-
-            # Step 7: Save backup metadata
-            logger.info("Step 7: Saving backup metadata...")
+            # Lazily walked so the first manifest list GET is issued before the walk completes
+            manifest_files = self._iter_manifest_files(abstracted_metadata, table_location)
+
+            # Step 5: Read manifest lists and manifests once to collect file references
+            logger.info("Step 5: Collecting manifest and data file references...")
+
+            manifest_list_paths, individual_manifest_paths, data_files, data_file_sizes = (
+                self._collect_manifests_and_data(manifest_files, table_location)
+            )
+            logger.debug(
+                f"Found {len(manifest_list_paths)} manifest lists, "
+                f"{len(individual_manifest_paths)} individual manifests "
+                f"and {len(data_files)} data files"
+            )
+
+            # Step 6: Build backup metadata (uploaded directly to S3 in the next step)
+            logger.info("Step 6: Building backup metadata...")
             backup_metadata = {
                 "original_database": self.database,
                 "original_table": self.table,
@@ -171,34 +154,26 @@ class IcebergBackup:
                 "abstracted_metadata": abstracted_metadata,
                 "manifest_lists": manifest_list_paths,
                 "individual_manifests": individual_manifest_paths,
-                "data_files": [PathAbstractor.abstract_path(f, table_location) for f in data_files],
+                "data_files": PathAbstractor.abstract_paths(data_files, table_location),
+                # Sizes recorded in the manifests, aligned with data_files (None if unknown)
+                "data_file_sizes": data_file_sizes,
             }
 
-            # Save to local work directory
-            backup_metadata_path = os.path.join(self.work_dir, "backup_metadata.json")
-            with open(backup_metadata_path, "w") as f:
-                json.dump(backup_metadata, f, indent=2)
-
-            # Step 8: Upload to backup bucket
-            logger.info("Step 8: Uploading backup to S3...")
+            # Step 7: Upload to backup bucket
+            logger.info("Step 7: Uploading backup to S3...")
             success = self._upload_backup_to_s3(backup_metadata, table_location)
 
             if success:
                 logger.info(f"Backup '{self.backup_name}' created successfully!")
                 # Include prefix in location path if configured
-                if Config.BACKUP_PREFIX:
-                    backup_location = f"s3://{Config.BACKUP_BUCKET}/{Config.BACKUP_PREFIX}/{self.backup_name}/"
-                else:
-                    backup_location = f"s3://{Config.BACKUP_BUCKET}/{self.backup_name}/"
+                backup_location = (
+                    f"s3://{Config.BACKUP_BUCKET}/{Config.get_backup_prefix(self.backup_name)}"
+                )
                 logger.info(f"Location: {backup_location}")
             else:
                 logger.error("Failed to upload backup to S3")
                 return False
 
-            # Cleanup
-            logger.info("Cleaning up temporary files...")
-            shutil.rmtree(self.work_dir, ignore_errors=True)
-
             return True
 
         except Exception as e:
@@ -207,97 +182,209 @@ class IcebergBackup:
         # Note: Not closing spark_client here as it may be shared with other processes
         # The caller or session fixture is responsible for closing the Spark session
 
-    def _collect_manifest_files(self, metadata: Dict, table_location: str) -> List[str]:
+    def _apply_snapshot_retention(self, metadata: Dict) -> None:
+        """
+        Drop snapshots excluded by current_only / min_snapshot_timestamp_ms.
+
+        Every retained snapshot drags in a manifest list and its manifests, so trimming
+        old history here shrinks all following steps. The current snapshot's manifest list
+        references every live manifest, so the table contents are unaffected; only time
+        travel to the dropped snapshots is lost (as after Iceberg's expire_snapshots).
+
+        Args:
+            metadata: Abstracted Iceberg metadata, modified in place
+        """
+        if not self.current_only and self.min_snapshot_timestamp_ms is None:
+            return
+
+        current_snapshot_id = metadata.get("current-snapshot-id")
+        snapshots = metadata.get("snapshots", [])
+        kept = [
+            snapshot
+            for snapshot in snapshots
+            if snapshot.get("snapshot-id") == current_snapshot_id
+            or (
+                not self.current_only
+                and snapshot.get("timestamp-ms", 0) >= self.min_snapshot_timestamp_ms
+            )
+        ]
+        if len(kept) == len(snapshots):
+            return
+
+        logger.info(f"Snapshot retention: keeping {len(kept)} of {len(snapshots)} snapshots")
+        metadata["snapshots"] = kept
+
+        # Branches, tags and statistics files may not point to snapshots that are no longer
+        # in the metadata
+        kept_ids = {snapshot.get("snapshot-id") for snapshot in kept}
+        if "refs" in metadata:
+            metadata["refs"] = {
+                name: ref
+                for name, ref in metadata["refs"].items()
+                if ref.get("snapshot-id") in kept_ids
+            }
+        for statistics_key in ("statistics", "partition-statistics"):
+            if statistics_key in metadata:
+                metadata[statistics_key] = [
+                    statistics
+                    for statistics in metadata[statistics_key]
+                    if statistics.get("snapshot-id") in kept_ids
+                ]
+
+    def _iter_manifest_files(self, metadata: Dict, table_location: str) -> Iterator[str]:
         """
-        Collect manifest file paths from snapshot ancestry chain.
+        Iterate manifest list file paths from snapshot ancestry chain.
 
         For backups, we collect manifest files from the complete snapshot ancestry chain
-        (from current snapshot back to root). This ensures all snapshots referenced by
-        the current snapshot are included, which is critical for:
-        - Proper application of position delete files
-        - Sequence number validation
-        - Maintaining snapshot parent references
+        (from current snapshot back to root), or from the snapshots left by
+        _apply_snapshot_retention, so the retained snapshots stay readable for time travel.
 
         Args:
             metadata: Parsed Iceberg metadata JSON containing snapshots (should be abstracted
                      metadata with complete snapshot ancestry)
             table_location: Base S3 location of the table for resolving relative paths
 
-        Returns:
-            List of full S3 URIs pointing to manifest list files (snap-*.avro)
+        Yields:
+            Full S3 URIs pointing to manifest list files (snap-*.avro)
         """
-        manifest_files = []
-
+        table_prefix = table_location.rstrip("/") + "/"
         # After abstraction, metadata contains the complete snapshot ancestry chain
         for snapshot in metadata.get("snapshots", []):
             if "manifest-list" in snapshot:
-                manifest_list_path = snapshot["manifest-list"]
                 # Convert relative paths to full S3 URIs
-                if not manifest_list_path.startswith("s3://") and not manifest_list_path.startswith(
-                    "s3a://"
-                ):
-                    # Relative path - combine with table location
-                    manifest_list_path = f"{table_location}/{manifest_list_path}"
-                manifest_files.append(manifest_list_path)
+                yield _absolutize(snapshot["manifest-list"], table_prefix)
 
-        return manifest_files
-
-    def _collect_data_files(self, manifest_list_files: List[str], table_location: str) -> List[str]:
+    def _collect_manifests_and_data(
+        self, manifest_list_files: Iterable[str], table_location: str
+    ) -> Tuple[List[str], List[str], List[str], List[Optional[int]]]:
         """
-        Collect all data file paths from manifest list and manifest files.
+        Collect manifest list, individual manifest and data file paths in a single pass.
 
         Traverses the manifest hierarchy: manifest lists -> individual manifests -> data files.
+        Every Avro object is downloaded at most once, and both levels are read concurrently
+        since every manifest is an independent S3 GET. A manifest is read as soon as the
+        manifest list referencing it is parsed, without waiting for the other manifest lists.
         Gracefully handles errors in individual files without failing the entire operation.
 
         Args:
-            manifest_list_files: List of full S3 URIs to manifest list files (snap-*.avro)
+            manifest_list_files: Full S3 URIs to manifest list files (snap-*.avro), consumed
+                                 lazily so reads start while the paths are still produced
             table_location: Base S3 location of the table for relative path resolution
 
         Returns:
-            List of S3 paths to data files referenced in the manifests
+            Tuple of (manifest_list_paths, individual_manifest_paths, data_files,
+            data_file_sizes) where the manifest paths are relative to the table location,
+            data_files are the distinct S3 paths referenced in the manifests (both data files
+            and delete files) and data_file_sizes their sizes as recorded in the manifests
         """
-        data_files = []
-
-        # manifest_list_files are actually manifest list files (snap-*.avro)
-        # which contain entries pointing to manifest files
-        for manifest_list_path in manifest_list_files:
-            try:
-                # Read the manifest list file
-                manifest_list_entries, _ = ManifestFileHandler.read_manifest_from_s3(
-                    self.s3_client, manifest_list_path, table_location
+        manifest_list_paths = []
+        # Relative manifest path -> full S3 URI; a dict gives O(1) de-duplication
+        # while keeping first-seen order deterministic
+        individual_manifests = {}
+        # Data file path -> size; the same file can be referenced from several manifests
+        # (e.g. existing entries carried over by later snapshots) but is copied only once
+        data_files = {}
+
+        def submitted_manifest_lists() -> Iterator[str]:
+            for manifest_list_path in manifest_list_files:
+                manifest_list_paths.append(
+                    PathAbstractor.abstract_path(manifest_list_path, table_location)
                 )
-                if not manifest_list_entries:
-                    continue
+                yield manifest_list_path
+
+        # Bound the reads in flight so parsed manifests are consumed as they arrive instead
+        # of accumulating for the whole table
+        max_pending = 2 * Config.MAX_WORKERS
+        table_prefix = table_location.rstrip("/") + "/"
+
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+
+            def discovered_manifests() -> Iterator[str]:
+                # Stage 1: read manifest lists as their paths are produced, and yield every
+                # distinct manifest as soon as the first manifest list referencing it is parsed
+                for manifest_paths in _map_bounded(
+                    executor,
+                    lambda path: self._read_manifest_paths(path, table_location),
+                    submitted_manifest_lists(),
+                    max_pending,
+                ):
+                    for manifest_path in manifest_paths:
+                        full_manifest_path = _absolutize(manifest_path, table_prefix)
+                        manifest_relative_path = PathAbstractor.abstract_path(
+                            full_manifest_path, table_location
+                        )
+                        if manifest_relative_path not in individual_manifests:
+                            logger.debug(f"Found individual manifest: {manifest_path}")
+                            individual_manifests[manifest_relative_path] = full_manifest_path
+                            yield full_manifest_path
+
+            # Stage 2: read each distinct manifest file to get all data files. Both stages
+            # share the pool, so manifest reads overlap with the remaining manifest list reads
+            for manifest_data_files in _map_bounded(
+                executor,
+                lambda path: self._read_data_files(path, table_location),
+                discovered_manifests(),
+                max_pending,
+            ):
+                for file_path, file_size in manifest_data_files:
+                    data_files.setdefault(file_path, file_size)
 
-                # Now read each manifest file to get all data files (including delete files)
-                for entry in manifest_list_entries:
-                    # Manifest list entries have a 'manifest_path' field
-                    manifest_path = entry.get("manifest_path")
-                    if not manifest_path:
-                        continue
+        return (
+            manifest_list_paths,
+            list(individual_manifests),
+            list(data_files),
+            list(data_files.values()),
+        )
 
-                    try:
-                        # Read the actual manifest file
-                        manifest_entries, _ = ManifestFileHandler.read_manifest_from_s3(
-                            self.s3_client, manifest_path, table_location
-                        )
-                        if not manifest_entries:
-                            continue
-
-                        # Collect all file paths (both data files and delete files)
-                        # Delete files will have their paths rewritten during restore
-                        for m_entry in manifest_entries:
-                            if "data_file" in m_entry and "file_path" in m_entry["data_file"]:
-                                data_files.append(m_entry["data_file"]["file_path"])
-                    except Exception as e:
-                        logger.warning(f"Could not read manifest file {manifest_path}: {e}")
-                        continue
+    def _read_manifest_paths(self, manifest_list_path: str, table_location: str) -> List[str]:
+        """
+        Read a manifest list and return the manifest paths it references.
+
+        Only the paths are decoded and held while other reads are still in flight.
+
+        Args:
+            manifest_list_path: Full S3 URI of a manifest list file (snap-*.avro)
+            table_location: Base S3 location of the table for relative path resolution
+
+        Returns:
+            Manifest paths as stored in the manifest list (empty if it could not be read)
+        """
+        # download_manifest logs and returns None on error
+        content = ManifestFileHandler.download_manifest(
+            self.s3_client, manifest_list_path, table_location
+        )
+        if content is None:
+            return []
+        try:
+            return ManifestFileHandler.read_manifest_list_paths(content)
+        except Exception as e:
+            logger.error(f"Error reading manifest {manifest_list_path}: {e}")
+            return []
 
-            except Exception as e:
-                logger.warning(f"Could not read manifest list {manifest_list_path}: {e}")
-                continue
+    def _read_data_files(
+        self, manifest_path: str, table_location: str
+    ) -> List[Tuple[str, Optional[int]]]:
+        """
+        Read a manifest and return the data files it references.
 
-        return data_files
+        Args:
+            manifest_path: Full S3 URI of a manifest file
+            table_location: Base S3 location of the table for relative path resolution
+
+        Returns:
+            (file_path, file_size_in_bytes) of both data files and delete files (empty if it
+            could not be read). Delete files will have their paths rewritten during restore.
+        """
+        content = ManifestFileHandler.download_manifest(
+            self.s3_client, manifest_path, table_location
+        )
+        if content is None:
+            return []
+        try:
+            return ManifestFileHandler.read_data_files(content)
+        except Exception as e:
+            logger.error(f"Error reading manifest {manifest_path}: {e}")
+            return []
 
     def _upload_backup_to_s3(self, backup_metadata: Dict, table_location: str) -> bool:
         """
@@ -321,102 +408,98 @@ class IcebergBackup:
         """
         try:
             # Construct backup prefix including any configured prefix from BACKUP_BUCKET
-            if Config.BACKUP_PREFIX:
-                backup_prefix = f"{Config.BACKUP_PREFIX}/{self.backup_name}/"
-            else:
-                backup_prefix = f"{self.backup_name}/"
+            backup_prefix = Config.get_backup_prefix(self.backup_name)
+            # Every manifest and data file lives under the table location, so its bucket and
+            # key prefix are parsed once; per-file source keys are plain concatenations
+            source_bucket, source_prefix = self.s3_client.parse_s3_uri(
+                table_location.rstrip("/") + "/"
+            )
 
-            # Upload backup metadata
-            metadata_key = f"{backup_prefix}backup_metadata.json"
-            metadata_content = json.dumps(backup_metadata, indent=2).encode("utf-8")
+            # Upload abstracted metadata file. It is serialized only here: backup_metadata.json
+            # does not embed a second copy, restore reads it from metadata.json. Written first
+            # so a backup_metadata.json is never visible without it
+            iceberg_metadata_key = f"{backup_prefix}metadata.json"
+            iceberg_content = json_utils.dumps(backup_metadata["abstracted_metadata"])
             if not self.s3_client.write_object(
-                Config.BACKUP_BUCKET, metadata_key, metadata_content
+                Config.BACKUP_BUCKET, iceberg_metadata_key, iceberg_content
             ):
                 return False
-            logger.info("Uploaded backup metadata")
+            logger.info("Uploaded Iceberg metadata")
 
-            # Upload abstracted metadata file
-            iceberg_metadata_key = f"{backup_prefix}metadata.json"
-            iceberg_content = json.dumps(backup_metadata["abstracted_metadata"], indent=2).encode(
-                "utf-8"
+            # Upload backup metadata
+            metadata_key = f"{backup_prefix}backup_metadata.json"
+            metadata_content = json_utils.dumps_gzip(
+                {
+                    key: value
+                    for key, value in backup_metadata.items()
+                    if key != "abstracted_metadata"
+                }
             )
             if not self.s3_client.write_object(
-                Config.BACKUP_BUCKET, iceberg_metadata_key, iceberg_content
+                Config.BACKUP_BUCKET, metadata_key, metadata_content, content_encoding="gzip"
             ):
                 return False
-            logger.info("Uploaded Iceberg metadata")
+            logger.info("Uploaded backup metadata")
 
-            # Copy manifest list files as raw Avro (no filtering needed)
+            # Copy manifest list and individual manifest files as raw Avro (no filtering
+            # needed). Every manifest is independent, so transfers run concurrently.
             manifest_lists = backup_metadata.get("manifest_lists", [])
-            for relative_path in manifest_lists:
-                full_path = f"{table_location}/{relative_path}"
-                try:
-                    # Download raw Avro from source
-                    bucket, key = self.s3_client.parse_s3_uri(full_path)
-                    content = self.s3_client.read_object(bucket, key)
-                    if content:
-                        # Upload raw Avro to backup
-                        manifest_key = f"{backup_prefix}{relative_path}"
-                        if not self.s3_client.write_object(
-                            Config.BACKUP_BUCKET, manifest_key, content
-                        ):
-                            logger.warning(f"Failed to upload manifest list {relative_path}")
-                except Exception as e:
-                    logger.warning(f"Could not copy manifest list {relative_path}: {e}")
-            logger.info(f"Uploaded {len(manifest_lists)} manifest list files")
-
-            # Copy individual manifest files as raw Avro (no filtering needed)
             individual_manifests = backup_metadata.get("individual_manifests", [])
-            for relative_path in individual_manifests:
-                full_path = f"{table_location}/{relative_path}"
-                try:
-                    # Download raw Avro from source
-                    bucket, key = self.s3_client.parse_s3_uri(full_path)
-                    content = self.s3_client.read_object(bucket, key)
-                    if content:
-                        # Upload raw Avro to backup
-                        manifest_key = f"{backup_prefix}{relative_path}"
-                        if not self.s3_client.write_object(
-                            Config.BACKUP_BUCKET, manifest_key, content
-                        ):
-                            logger.warning(
-                                f"Failed to upload individual manifest {relative_path}"
-                            )
-                except Exception as e:
-                    logger.warning(f"Could not copy individual manifest {relative_path}: {e}")
+            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        self._copy_manifest,
+                        relative_path,
+                        source_bucket,
+                        source_prefix,
+                        backup_prefix,
+                    ): relative_path
+                    for relative_path in manifest_lists + individual_manifests
+                }
+                for future in as_completed(futures):
+                    relative_path = futures[future]
+                    try:
+                        if not future.result():
+                            logger.warning(f"Failed to upload manifest {relative_path}")
+                    except Exception as e:
+                        logger.warning(f"Could not copy manifest {relative_path}: {e}")
+            logger.info(f"Uploaded {len(manifest_lists)} manifest list files")
             logger.info(f"Uploaded {len(individual_manifests)} individual manifest files")
 
             # Copy data files (Parquet/ORC/Avro files)
             data_files = backup_metadata.get("data_files", [])
+            # Sizes let large files go straight to a multipart copy whose part ranges come from
+            # the manifest instead of a HEAD request
+            data_file_sizes = backup_metadata.get("data_file_sizes") or [None] * len(data_files)
             if data_files:
                 logger.info(f"Copying {len(data_files)} data files...")
                 copied_count = 0
                 failed_count = 0
-
-                for i, relative_path in enumerate(data_files, 1):
-                    # Log progress every 10 files or at the end
-                    if i % 10 == 0 or i == len(data_files):
-                        logger.info(f"  Progress: {i}/{len(data_files)} data files processed...")
-
-                    full_path = f"{table_location}/{relative_path}"
-                    try:
-                        # Parse source S3 URI
-                        source_bucket, source_key = self.s3_client.parse_s3_uri(full_path)
-
-                        # Construct destination key
-                        dest_key = f"{backup_prefix}{relative_path}"
-
-                        # Copy the file using S3 copy operation (more efficient than download/upload)
-                        if self.s3_client.copy_object(
-                            source_bucket, source_key, Config.BACKUP_BUCKET, dest_key
-                        ):
+                # Report progress in ~10% steps so large tables don't emit a line per 10 files
+                progress_every = max(10, len(data_files) // 10)
+
+                # Every copy is an independent server-side request, so they run concurrently,
+                # with a bounded number of pending copies regardless of the table size
+                with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                    copy_results = _map_bounded(
+                        executor,
+                        lambda data_file: self._copy_data_file(
+                            *data_file, source_bucket, source_prefix, backup_prefix
+                        ),
+                        zip(data_files, data_file_sizes),
+                        2 * Config.MAX_WORKERS,
+                    )
+                    for i, copied in enumerate(copy_results, 1):
+                        if copied:
                             copied_count += 1
                         else:
                             failed_count += 1
-                            logger.warning(f"Failed to copy data file: {relative_path}")
-                    except Exception as e:
-                        failed_count += 1
-                        logger.warning(f"Could not copy data file {relative_path}: {e}")
+
+                        # Log progress every progress_every files or at the end
+                        if i % progress_every == 0 or i == len(data_files):
+                            logger.info(
+                                f"  Progress: {i}/{len(data_files)} data files processed..."
+                            )
 
                 logger.info(
                     f"Data file copy complete: {copied_count} succeeded, {failed_count} failed"
@@ -435,6 +518,115 @@ class IcebergBackup:
             logger.error(f"Error uploading to S3: {e}")
             return False
 
+    def _copy_manifest(
+        self, relative_path: str, source_bucket: str, source_prefix: str, backup_prefix: str
+    ) -> bool:
+        """
+        Copy a single manifest file (raw Avro) from the table location to the backup.
+
+        Uses a server-side S3 copy so the bytes never pass through this process. Falls
+        back to download/upload when the copy is rejected (e.g. cross-region buckets or
+        mismatched KMS keys).
+
+        Args:
+            relative_path: Manifest path relative to the table location
+            source_bucket: Bucket of the original table location
+            source_prefix: Key prefix of the original table location with a trailing slash
+            backup_prefix: Key prefix of this backup in the backup bucket
+
+        Returns:
+            True if the manifest was uploaded, False otherwise
+        """
+        source_key = f"{source_prefix}{relative_path}"
+        dest_key = f"{backup_prefix}{relative_path}"
+        if self.s3_client.copy_object(source_bucket, source_key, Config.BACKUP_BUCKET, dest_key):
+            return True
+
+        # Fall back to streaming the raw Avro through the client
+        logger.debug(f"Server-side copy failed for {relative_path}, retrying via download")
+        body = self.s3_client.open_object_stream(source_bucket, source_key)
+        try:
+            return self.s3_client.write_object_stream(Config.BACKUP_BUCKET, dest_key, body)
+        finally:
+            body.close()
+
+    def _copy_data_file(
+        self,
+        relative_path: str,
+        size: Optional[int],
+        source_bucket: str,
+        source_prefix: str,
+        backup_prefix: str,
+    ) -> bool:
+        """
+        Copy a single data file from the table location to the backup (server-side).
+
+        Args:
+            relative_path: Data file path relative to the table location
+            size: File size in bytes from the manifest, if known
+            source_bucket: Bucket of the original table location
+            source_prefix: Key prefix of the original table location with a trailing slash
+            backup_prefix: Key prefix of this backup in the backup bucket
+
+        Returns:
+            True if the file was copied, False otherwise (failures are logged as warnings)
+        """
+        try:
+            # Copy the file using S3 copy operation (more efficient than download/upload)
+            if self.s3_client.copy_object(
+                source_bucket,
+                f"{source_prefix}{relative_path}",
+                Config.BACKUP_BUCKET,
+                f"{backup_prefix}{relative_path}",
+                size=size,
+            ):
+                return True
+            logger.warning(f"Failed to copy data file: {relative_path}")
+        except Exception as e:
+            logger.warning(f"Could not copy data file {relative_path}: {e}")
+        return False
+
+
+def _absolutize(path: str, table_prefix: str) -> str:
+    """
+    Resolve a path relative to the table location to a full S3 URI.
+
+    Args:
+        path: Absolute S3 URI or path relative to the table location
+        table_prefix: Table location with a trailing slash
+
+    Returns:
+        The path itself if it is already absolute, otherwise table_prefix + path
+    """
+    return path if PathAbstractor.is_s3_uri(path) else table_prefix + path
+
+
+def _map_bounded(
+    executor: ThreadPoolExecutor, fn: Callable, items: Iterable, max_pending: int
+) -> Iterator:
+    """
+    Like executor.map, but keeps at most max_pending results waiting to be consumed.
+
+    Items are pulled from the iterable lazily and results are yielded in input order,
+    so memory stays bounded regardless of how many items there are.
+
+    Args:
+        executor: Executor to run fn on
+        fn: Function applied to every item
+        items: Items to process (may be a generator)
+        max_pending: Maximum number of submitted calls whose results were not yet yielded
+
+    Yields:
+        fn(item) for every item, in order
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
 
 def main():
     """Main entry point for backup script"""
@@ -447,6 +639,17 @@ def main():
         default=None,
         help="Catalog name (optional). Falls back to CATALOG_NAME env var, then Config default",
     )
+    parser.add_argument(
+        "--current-only",
+        action="store_true",
+        help="Only back up the current snapshot (restored table has no time travel history)",
+    )
+    parser.add_argument(
+        "--min-snapshot-timestamp-ms",
+        type=int,
+        default=None,
+        help="Skip snapshots committed before this epoch timestamp in milliseconds",
+    )
     parser.add_argument("--log-level", default="INFO", help="Log level (DEBUG, INFO, WARNING, ERROR)")
     parser.add_argument("--log-file", default=None, help="Optional log file path")
 
@@ -456,7 +659,14 @@ def main():
     BCNLogger.setup_logging(level=args.log_level, log_file=args.log_file)
 
     # Create backup
-    backup = IcebergBackup(args.database, args.table, args.backup_name, catalog=args.catalog)
+    backup = IcebergBackup(
+        args.database,
+        args.table,
+        args.backup_name,
+        catalog=args.catalog,
+        current_only=args.current_only,
+        min_snapshot_timestamp_ms=args.min_snapshot_timestamp_ms,
+    )
     success = backup.create_backup()
 
     sys.exit(0 if success else 1)
@@ -3,6 +3,7 @@ Configuration for Iceberg Snapshot Backup/Restore
 """
 
 import os
+import re
 
 
 class Config:
@@ -45,7 +46,7 @@ class Config:
 
         # Normalize s3a:// and s3n:// to s3://
         normalized = bucket_config
-        if bucket_config.startswith("s3a://") or bucket_config.startswith("s3n://"):
+        if bucket_config.startswith(("s3a://", "s3n://")):
             normalized = "s3://" + bucket_config[6:]
 
         # If it's an S3 URI, parse it
@@ -73,8 +74,8 @@ class Config:
     # Hive Metastore Configuration (only used when CATALOG_TYPE=hive)
     HIVE_METASTORE_URI = os.getenv("HIVE_METASTORE_URI", "thrift://localhost:9083")
 
-    # Working directory for temporary files
-    WORK_DIR = os.getenv("WORK_DIR", "/tmp/iceberg-snapshots")
+    # Concurrency for independent S3 requests (manifest reads, object copies)
+    MAX_WORKERS = int(os.getenv("BCN_MAX_WORKERS", "32"))
 
     # Logging configuration
     LOG_LEVEL = os.getenv("BCN_LOG_LEVEL", "INFO")
@@ -84,6 +85,42 @@ class Config:
     METADATA_DIR = "metadata"
     DATA_DIR = "data"
 
+    # Allowed characters for backup names (used as S3 key prefixes)
+    BACKUP_NAME_PATTERN = re.compile(r"[a-zA-Z0-9_-]+")
+
+    @classmethod
+    def validate_backup_name(cls, backup_name: str) -> None:
+        """
+        Check that a backup name is safe to use as an S3 key prefix
+
+        Args:
+            backup_name: Name of the backup
+
+        Raises:
+            ValueError: If the name contains characters other than letters, numbers,
+                hyphens and underscores
+        """
+        if not cls.BACKUP_NAME_PATTERN.fullmatch(backup_name):
+            raise ValueError(
+                "Backup name must contain only letters, numbers, hyphens, and underscores"
+            )
+
+    @classmethod
+    def get_backup_prefix(cls, backup_name: str) -> str:
+        """
+        Get the key prefix of a backup in the backup bucket
+
+        Args:
+            backup_name: Name of the backup
+
+        Returns:
+            Key prefix ending with a slash, including BACKUP_PREFIX if configured
+            (e.g. "prefix/my_backup/" or "my_backup/")
+        """
+        if cls.BACKUP_PREFIX:
+            return f"{cls.BACKUP_PREFIX}/{backup_name}/"
+        return f"{backup_name}/"
+
     @classmethod
     def get_s3_config(cls):
         """Get S3 configuration as a dictionary"""
@@ -9,7 +9,7 @@ need to be updated to match the new data file locations.
 import io
 from typing import Optional
 
-import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from bcn.logging_config import BCNLogger
@@ -48,74 +48,83 @@ class DeleteFileRewriter:
                 pos: 123
         """
         try:
-            # Read the Parquet file from bytes
+            # Open the Parquet file from bytes; row groups are decoded one at a time below
             reader = pq.ParquetFile(io.BytesIO(delete_file_content))
-            table = reader.read()
+            schema = reader.schema_arrow
 
             # Check if this is actually a delete file (has file_path column)
-            if "file_path" not in table.column_names:
+            if "file_path" not in schema.names:
                 logger.warning("Delete file missing 'file_path' column, skipping rewrite")
                 return delete_file_content
 
-            # Get the file_path column
-            file_path_column = table.column("file_path")
-
-            # Convert to Python strings, update paths, convert back
-            updated_paths = []
-            for path in file_path_column.to_pylist():
-                if path and isinstance(path, str):
-                    # Replace old location with new location
-                    if path.startswith(old_location):
-                        new_path = new_location + path[len(old_location) :]
-                        updated_paths.append(new_path)
-                        logger.debug(f"Rewrote path: {path} -> {new_path}")
-                    else:
-                        logger.warning(
-                            f"Path doesn't start with old location: {path} "
-                            f"(expected prefix: {old_location})"
-                        )
-                        updated_paths.append(path)
-                else:
-                    updated_paths.append(path)
-
-            # Create new table with updated file_path column
-            # IMPORTANT: Must preserve the original schema including Iceberg field ID metadata
-            new_file_path_array = pa.array(updated_paths, type=file_path_column.type)
-
-            # Find the index of the file_path column
-            file_path_idx = table.column_names.index("file_path")
-
-            # Rebuild the table with updated column but PRESERVE original schema
-            new_columns = []
-            for i, column in enumerate(table.columns):
-                if i == file_path_idx:
-                    new_columns.append(new_file_path_array)
-                else:
-                    new_columns.append(column)
-
-            # Use the original schema to preserve Iceberg field IDs and metadata
-            new_table = pa.Table.from_arrays(new_columns, schema=table.schema)
-
-            # Write back to Parquet bytes
-            # IMPORTANT: Preserve Parquet metadata and writer version for Iceberg compatibility
-            output = io.BytesIO()
-
-            # Get original Parquet file metadata
-            original_metadata = reader.metadata
+            file_path_idx = schema.get_field_index("file_path")
+            # The original field keeps the Iceberg field ID metadata of the rewritten column
+            file_path_field = schema.field(file_path_idx)
+
+            # Decode-only pass over the file_path column so files with nothing to rewrite are
+            # returned as-is, without re-encoding and ZSTD recompression
+            if not any(
+                pc.any(
+                    pc.starts_with(
+                        reader.read_row_group(i, columns=["file_path"]).column(0), old_location
+                    )
+                ).as_py()
+                for i in range(reader.num_row_groups)
+            ):
+                logger.debug("Delete file has no paths under the old location, keeping it as-is")
+                return delete_file_content
 
-            pq.write_table(
-                new_table,
+            # Stream row group by row group into the writer so only one decoded row group is
+            # held at a time and the source row-group layout is kept
+            output = io.BytesIO()
+            matched_count = 0
+            unmatched_count = 0
+            with pq.ParquetWriter(
                 output,
+                schema,
                 compression="ZSTD",  # Match Iceberg default
                 write_statistics=True,  # Maintain statistics for bounds
                 version="2.6",  # Use Parquet 2.6 for Iceberg compatibility
-                # Preserve the original schema including all Iceberg metadata
-            )
+            ) as writer:
+                for i in range(reader.num_row_groups):
+                    row_group = reader.read_row_group(i)
+                    file_path_column = row_group.column(file_path_idx)
+
+                    # Swap the old location prefix for the new one with Arrow compute kernels,
+                    # which work on the string buffers directly instead of one str per row
+                    matches_old_location = pc.starts_with(file_path_column, old_location)
+                    row_group_matched = pc.sum(matches_old_location).as_py() or 0
+                    matched_count += row_group_matched
+                    # Rows with a path outside the old location are kept as-is
+                    unmatched_count += len(file_path_column) - row_group_matched
+
+                    if row_group_matched:
+                        # utf8_replace_slice counts code points like len(old_location), so
+                        # non-ASCII locations are not cut mid-character
+                        replaced_paths = pc.utf8_replace_slice(
+                            file_path_column,
+                            start=0,
+                            stop=len(old_location),
+                            replacement=new_location,
+                        )
+                        # Swap in the updated column by reference; other columns are kept
+                        row_group = row_group.set_column(
+                            file_path_idx,
+                            file_path_field,
+                            pc.if_else(matches_old_location, replaced_paths, file_path_column),
+                        )
+                    writer.write_table(row_group)
+
+            if unmatched_count:
+                logger.warning(
+                    f"{unmatched_count} paths don't start with old location "
+                    f"(expected prefix: {old_location})"
+                )
 
             rewritten_content = output.getvalue()
             logger.debug(
                 f"Rewrote delete file: {len(delete_file_content)} bytes -> "
-                f"{len(rewritten_content)} bytes, updated {len(updated_paths)} paths"
+                f"{len(rewritten_content)} bytes, updated {matched_count} paths"
             )
 
             return rewritten_content
@@ -4,19 +4,33 @@ Iceberg metadata utilities for parsing and modifying Iceberg table files
 
 import copy
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import avro.datafile
-import avro.io
-import avro.schema
+import fastavro
 
 if TYPE_CHECKING:
     from bcn.s3_client import S3Client
 
+# Schemes of paths that are already absolute S3 URIs
+_S3_SCHEMES = ("s3://", "s3a://")
+
 
 class PathAbstractor:
     """Handles path abstraction and restoration for backup/restore"""
 
+    @staticmethod
+    def is_s3_uri(path: str) -> bool:
+        """
+        Check whether a path is an absolute S3 URI (s3:// or s3a://)
+
+        Args:
+            path: Absolute or table-relative path
+
+        Returns:
+            True if the path carries an S3 scheme
+        """
+        return path.startswith(_S3_SCHEMES)
+
     @staticmethod
     def abstract_path(full_path: str, table_location: str) -> str:
         """
@@ -41,6 +55,28 @@ class PathAbstractor:
         # If paths don't match, return as-is (might be a relative path already)
         return full_path
 
+    @staticmethod
+    def abstract_paths(paths: List[str], table_location: str) -> List[str]:
+        """
+        Abstract many full paths against the same table location
+
+        Batch form of abstract_path for large lists (e.g. data files): the table location
+        prefix is normalized once instead of once per path.
+
+        Args:
+            paths: Full paths (e.g., s3://bucket/warehouse/db/table/data/00000.parquet)
+            table_location: Table location (e.g., s3://bucket/warehouse/db/table)
+
+        Returns:
+            Abstracted relative paths in the same order; paths outside the table location
+            are returned as-is
+        """
+        prefix = table_location.rstrip("/") + "/"
+        prefix_len = len(prefix)
+        return [
+            path[prefix_len:].lstrip("/") if path.startswith(prefix) else path for path in paths
+        ]
+
     @staticmethod
     def restore_path(relative_path: str, new_table_location: str) -> str:
         """
@@ -88,13 +124,10 @@ class PathAbstractor:
         Abstract paths in main metadata file and keep snapshot ancestry chain.
 
         For a restored table, we preserve the complete snapshot ancestry chain from the
-        current snapshot back to the root. This is critical for proper handling of:
-        - Position delete files that reference earlier snapshots
-        - Sequence number validation
-        - Parent snapshot references in the current snapshot
-
-        Without the full ancestry, query engines may skip applying delete files,
-        resulting in incorrect row counts.
+        current snapshot back to the root, so time travel and parent snapshot references
+        keep working. Reading the current snapshot does not depend on its ancestors: its
+        manifest list references every live data and delete manifest, and delete files are
+        applied by the sequence numbers recorded there.
 
         Args:
             metadata_content: Parsed metadata JSON content
@@ -159,129 +192,128 @@ class PathAbstractor:
 
 
 class ManifestFileHandler:
-    """Handles reading and writing Avro manifest files"""
+    """Handles downloading and reading Avro manifest files"""
 
     @staticmethod
-    def write_manifest_list(entries: List[Dict], schema: Any) -> bytes:
+    def read_manifest_file(content: bytes) -> Tuple[List[Dict], Optional[Dict]]:
         """
-        Write manifest entries to Avro format
+        Read an Avro manifest file
 
         Args:
-            entries: List of manifest entries
-            schema: Avro schema
+            content: Binary content of manifest file
 
         Returns:
-            Binary content of manifest list file
+            Tuple of (list of data file entries, schema the file was written with)
         """
-        output = BytesIO()
-        writer = avro.datafile.DataFileWriter(output, avro.io.DatumWriter(), schema)
-        for entry in entries:
-            writer.append(entry)
-        writer.flush()
-        # Get the value before closing
-        result = output.getvalue()
-        writer.close()
-        return result
+        reader = fastavro.reader(BytesIO(content))
+        return list(reader), reader.writer_schema
 
     @staticmethod
-    def _convert_bytes_to_str(obj: Any) -> Any:
-        """
-        Recursively convert bytes to base64 strings for JSON serialization
+    def _project_schema(
+        writer_schema: Dict, record_path: Tuple[str, ...], field_names: Tuple[str, ...]
+    ) -> Optional[Dict]:
         """
-        import base64
-
-        if isinstance(obj, bytes):
-            return {"__type__": "bytes", "__value__": base64.b64encode(obj).decode("utf-8")}
-        elif isinstance(obj, dict):
-            return {k: ManifestFileHandler._convert_bytes_to_str(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [ManifestFileHandler._convert_bytes_to_str(item) for item in obj]
-        else:
-            return obj
+        Build a reader schema that keeps only a few fields of a (possibly nested) record
 
-    @staticmethod
-    def restore_manifest_paths(entries: List[Dict], new_table_location: str) -> List[Dict]:
-        """
-        Restore paths in manifest list entries
+        Record names are taken from the writer schema, so Avro schema resolution matches
+        them and skips the bytes of every other field (partition values, column metrics,
+        bounds) instead of decoding them.
 
         Args:
-            entries: List of manifest entries with abstracted paths
-            new_table_location: New table location
+            writer_schema: Record schema the file was written with
+            record_path: Field names from the top-level record down to the nested record
+                         holding the kept fields (empty for the top-level record)
+            field_names: Names of the fields to keep in that record
 
         Returns:
-            Modified manifest entries with restored paths
+            Projected record schema, or None if record_path is not a chain of record fields
+            or none of field_names exist
+        """
+        fields = writer_schema.get("fields", [])
+        if not record_path:
+            kept = [f for f in fields if f["name"] in field_names]
+            return {**writer_schema, "fields": kept} if kept else None
+
+        field = next((f for f in fields if f["name"] == record_path[0]), None)
+        if field is None:
+            return None
+        nested_schema = field["type"]
+        if not isinstance(nested_schema, dict) or nested_schema.get("type") != "record":
+            return None
+        nested_projection = ManifestFileHandler._project_schema(
+            nested_schema, record_path[1:], field_names
+        )
+        if nested_projection is None:
+            return None
+        return {**writer_schema, "fields": [{**field, "type": nested_projection}]}
+
+    @staticmethod
+    def _read_projected(
+        content: bytes, record_path: Tuple[str, ...], field_names: Tuple[str, ...]
+    ) -> List[Dict]:
         """
-        import copy
-
-        restored = []
-        for entry in entries:
-            entry_copy = copy.deepcopy(entry)
-            if "manifest_path" in entry_copy:
-                entry_copy["manifest_path"] = PathAbstractor.restore_path(
-                    entry_copy["manifest_path"], new_table_location
-                )
-            restored.append(entry_copy)
-        return restored
+        Read the records of an Avro file, decoding only the given fields
+
+        Falls back to decoding full records if the projection can't be built.
+        """
+        with BytesIO(content) as bio:
+            writer_schema = fastavro.reader(bio).writer_schema
+            bio.seek(0)
+            reader_schema = ManifestFileHandler._project_schema(
+                writer_schema, record_path, field_names
+            )
+            return list(fastavro.reader(bio, reader_schema=reader_schema))
 
     @staticmethod
-    def abstract_manifest_paths_avro(entries: List[Dict], table_location: str) -> List[Dict]:
+    def read_manifest_list_paths(content: bytes) -> List[str]:
         """
-        Abstract paths in manifest list entries (Avro format, no bytes conversion)
+        Read the manifest paths referenced by an Avro manifest list file
+
+        Uses fastavro with a reader schema projected to manifest_path, so only the paths
+        are decoded instead of every entry and the schema like read_manifest_file.
 
         Args:
-            entries: List of manifest entries
-            table_location: Table location to abstract
+            content: Binary content of manifest list file
 
         Returns:
-            Modified manifest entries with abstracted paths
+            Manifest paths as stored in the manifest list
         """
-        import copy
-
-        abstracted = []
-        for entry in entries:
-            entry_copy = copy.deepcopy(entry)
-            if "manifest_path" in entry_copy:
-                entry_copy["manifest_path"] = PathAbstractor.abstract_path(
-                    entry_copy["manifest_path"], table_location
-                )
-            abstracted.append(entry_copy)
-        return abstracted
+        records = ManifestFileHandler._read_projected(content, (), ("manifest_path",))
+        return [record["manifest_path"] for record in records if record.get("manifest_path")]
 
     @staticmethod
-    def read_manifest_file(content: bytes) -> Tuple[List[Dict], Any]:
+    def read_data_files(content: bytes) -> List[Tuple[str, Optional[int]]]:
         """
-        Read an Avro manifest file
+        Read the data files referenced by an Avro manifest file
+
+        Uses fastavro with a reader schema projected to data_file.file_path and
+        data_file.file_size_in_bytes, so only those are decoded instead of every entry and
+        the schema like read_manifest_file.
 
         Args:
             content: Binary content of manifest file
 
         Returns:
-            Tuple of (list of data file entries, schema)
+            (file_path, file_size_in_bytes) of both data files and delete files; the size is
+            None if the manifest doesn't record it
         """
-        entries = []
-        schema = None
-        with BytesIO(content) as bio:
-            reader = avro.datafile.DataFileReader(bio, avro.io.DatumReader())
-            # Get the schema from the Avro file's metadata
-            # The schema is stored in the meta dictionary with key 'avro.schema'
-            schema_str = reader.meta.get("avro.schema")
-            if schema_str:
-                schema = avro.schema.parse(
-                    schema_str.decode("utf-8") if isinstance(schema_str, bytes) else schema_str
-                )
-            for record in reader:
-                entries.append(record)
-            reader.close()
-        return entries, schema
+        records = ManifestFileHandler._read_projected(
+            content, ("data_file",), ("file_path", "file_size_in_bytes")
+        )
+        return [
+            (record["data_file"]["file_path"], record["data_file"].get("file_size_in_bytes"))
+            for record in records
+            if "data_file" in record and "file_path" in record["data_file"]
+        ]
 
     @staticmethod
-    def read_manifest_from_s3(
+    def download_manifest(
         s3_client: "S3Client",
         manifest_path: str,
         table_location: str
-    ) -> Tuple[Optional[List[Dict]], Optional[Any]]:
+    ) -> Optional[bytes]:
         """
-        Read manifest file from S3
+        Download a manifest file from S3
 
         Args:
             s3_client: S3 client instance
@@ -289,98 +321,25 @@ class ManifestFileHandler:
             table_location: Table location for resolving relative paths
 
         Returns:
-            Tuple of (entries, schema) or (None, None) on error
+            Raw Avro content or None on error
         """
         from bcn.logging_config import BCNLogger
 
         logger = BCNLogger.get_logger(__name__)
 
         # Convert relative paths to full S3 URIs
-        if not manifest_path.startswith("s3://") and not manifest_path.startswith("s3a://"):
-            full_path = PathAbstractor.resolve_path(manifest_path, table_location)
-        else:
+        if PathAbstractor.is_s3_uri(manifest_path):
             full_path = manifest_path
+        else:
+            full_path = PathAbstractor.resolve_path(manifest_path, table_location)
 
         try:
             bucket, key = s3_client.parse_s3_uri(full_path)
             content = s3_client.read_object(bucket, key)
             if not content:
                 logger.warning(f"Empty content for manifest: {manifest_path}")
-                return None, None
-
-            return ManifestFileHandler.read_manifest_file(content)
+                return None
+            return content
         except Exception as e:
             logger.error(f"Error reading manifest {manifest_path}: {e}")
-            return None, None
-
-    @staticmethod
-    def abstract_manifest_data_paths(entries: List[Dict], table_location: str) -> List[Dict]:
-        """
-        Abstract data file paths in manifest entries
-
-        Args:
-            entries: List of manifest data entries
-            table_location: Table location to abstract
-
-        Returns:
-            Modified manifest entries with abstracted data file paths
-        """
-        abstracted = []
-        for entry in entries:
-            # Convert bytes to base64 strings for JSON serialization
-            entry_copy = ManifestFileHandler._convert_bytes_to_str(entry.copy())
-
-            if "data_file" in entry_copy and "file_path" in entry_copy["data_file"]:
-                entry_copy["data_file"]["file_path"] = PathAbstractor.abstract_path(
-                    entry_copy["data_file"]["file_path"], table_location
-                )
-            abstracted.append(entry_copy)
-        return abstracted
-
-    @staticmethod
-    def restore_manifest_data_paths(entries: List[Dict], new_table_location: str) -> List[Dict]:
-        """
-        Restore data file paths in manifest entries
-
-        Args:
-            entries: List of manifest data entries with abstracted paths
-            new_table_location: New table location
-
-        Returns:
-            Modified manifest entries with restored data file paths
-        """
-        import copy
-
-        restored = []
-        for entry in entries:
-            entry_copy = copy.deepcopy(entry)
-            if "data_file" in entry_copy and "file_path" in entry_copy["data_file"]:
-                entry_copy["data_file"]["file_path"] = PathAbstractor.restore_path(
-                    entry_copy["data_file"]["file_path"], new_table_location
-                )
-            restored.append(entry_copy)
-        return restored
-
-    @staticmethod
-    def abstract_manifest_data_paths_avro(entries: List[Dict], table_location: str) -> List[Dict]:
-        """
-        Abstract data file paths in manifest entries (Avro format, no bytes conversion)
-
-        Args:
-            entries: List of manifest data entries
-            table_location: Table location to abstract
-
-        Returns:
-            Modified manifest entries with abstracted data file paths
-        """
-        import copy
-
-        abstracted = []
-        for entry in entries:
-            entry_copy = copy.deepcopy(entry)
-            if "data_file" in entry_copy and "file_path" in entry_copy["data_file"]:
-                entry_copy["data_file"]["file_path"] = PathAbstractor.abstract_path(
-                    entry_copy["data_file"]["file_path"], table_location
-                )
-            abstracted.append(entry_copy)
-        return abstracted
+            return None
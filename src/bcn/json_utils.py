@@ -0,0 +1,80 @@
+"""
+JSON serialization helpers for backup/restore payloads
+
+Uses orjson when it is installed (optional "fast" extra) and falls back to the
+standard library json module otherwise. Output is always compact UTF-8 bytes since
+the payloads are machine-read artifacts stored in S3.
+"""
+
+import gzip
+import json
+from typing import Any
+
+# First bytes of every gzip stream
+_GZIP_MAGIC = b"\x1f\x8b"
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON bytes without indentation or extra whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(content: bytes) -> Any:
+    """
+    Deserialize JSON from raw bytes without an intermediate str decode
+
+    Args:
+        content: UTF-8 encoded JSON document
+
+    Returns:
+        Parsed JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_gzip(obj: Any) -> bytes:
+    """
+    Serialize an object to gzip-compressed compact JSON
+
+    Backup metadata is highly repetitive (keys, relative data file paths), so it
+    compresses several times over and fewer bytes are moved on every PUT/GET.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Gzip-compressed UTF-8 JSON bytes
+    """
+    return gzip.compress(dumps(obj), compresslevel=6)
+
+
+def loads_maybe_gzip(content: bytes) -> Any:
+    """
+    Deserialize JSON that may or may not be gzip-compressed
+
+    Args:
+        content: Plain or gzip-compressed UTF-8 JSON document
+
+    Returns:
+        Parsed JSON object
+    """
+    if content[:2] == _GZIP_MAGIC:
+        content = gzip.decompress(content)
+    return loads(content)
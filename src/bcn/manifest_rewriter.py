@@ -31,31 +31,28 @@ class ManifestRewriter:
             deleted_files_sizes: Dictionary mapping deleted file paths to their sizes
 
         Returns:
-            Rewritten manifest content as bytes, or None if no rewriting needed
+            Rewritten manifest content as bytes, the original manifest_content (same object)
+            if no path needed rewriting, or None if the manifest could not be rewritten
         """
         try:
-            # Read the manifest Avro file
-            reader = fastavro.reader(io.BytesIO(manifest_content))
-            schema = reader.writer_schema
-            records = list(reader)
-
-            if not records:
-                return manifest_content
-
-            # Track if any changes were made
-            changes_made = False
-
-            # Process each record - each record IS an entry (not wrapped in an "entries" field)
-            for record in records:
+            # Prefix forms and lengths used for every record, computed once
+            old_location_len = len(old_location)
+            old_location_bytes = old_location.encode("utf-8")
+            old_location_bytes_len = len(old_location_bytes)
+            new_location_bytes = new_location.encode("utf-8")
+
+            def rewrite_record(record: dict) -> bool:
+                """Rewrite the paths of one record in place, returning whether any changed"""
+                changes_made = False
                 # Check if this is a manifest list (has manifest_path) or individual manifest (has data_file)
                 if "manifest_path" in record:
                     # This is a manifest list entry - update manifest_path
                     manifest_path = record.get("manifest_path", "")
                     if manifest_path and manifest_path.startswith(old_location):
-                        new_path = new_location + manifest_path[len(old_location) :]
+                        new_path = new_location + manifest_path[old_location_len:]
                         record["manifest_path"] = new_path
                         changes_made = True
-                    continue
+                    return changes_made
 
                 # This is an individual manifest entry - process data_file
                 data_file = record.get("data_file", {})
@@ -63,10 +60,10 @@ class ManifestRewriter:
                 # Update file_path in data_file
                 file_path = data_file.get("file_path", "")
                 if file_path and file_path.startswith(old_location):
-                    new_path = new_location + file_path[len(old_location) :]
+                    new_path = new_location + file_path[old_location_len:]
                     data_file["file_path"] = new_path
 
-                    name_without_prefix = file_path[len(old_location) + 1 :]
+                    name_without_prefix = file_path[old_location_len + 1 :]
                     # Update file_size in data_file if it matches a deleted file
                     if name_without_prefix in deleted_files_sizes:
                         data_file["file_size_in_bytes"] = deleted_files_sizes[name_without_prefix]
@@ -74,55 +71,43 @@ class ManifestRewriter:
                         for key in ["column_sizes", "value_counts", "null_value_counts", "lower_bounds", "upper_bounds", "nan_value_counts"]:
                             data_file.pop(key, None)
                     changes_made = True
-                    
-                # Update lower_bounds - check all fields for paths (not just field ID 134)
-                # Some schemas use different field IDs (e.g., 2147483546)
-                lower_bounds = data_file.get("lower_bounds")
-                if lower_bounds:
-                    for bound in lower_bounds:
-                        value = bound.get("value")
-                        if value:
-                            try:
-                                # Decode as UTF-8 string
-                                path_str = value.decode("utf-8")
-                                if path_str.startswith(old_location):
-                                    new_path = new_location + path_str[len(old_location) :]
-                                    bound["value"] = new_path.encode("utf-8")
-                                    changes_made = True
-                            except (UnicodeDecodeError, AttributeError):
-                                # If it's already a string, handle it
-                                if isinstance(value, str) and value.startswith(old_location):
-                                    new_path = new_location + value[len(old_location) :]
-                                    bound["value"] = new_path.encode("utf-8")
-                                    changes_made = True
-
-                # Update upper_bounds - check all fields for paths (not just field ID 134)
-                # Some schemas use different field IDs (e.g., 2147483546)
-                upper_bounds = data_file.get("upper_bounds")
-                if upper_bounds:
-                    for bound in upper_bounds:
+
+                # Update lower_bounds/upper_bounds - check all fields for paths (not just
+                # field ID 134). Some schemas use different field IDs (e.g., 2147483546)
+                for bounds_key in ("lower_bounds", "upper_bounds"):
+                    for bound in data_file.get(bounds_key) or ():
                         value = bound.get("value")
-                        if value:
-                            try:
-                                # Decode as UTF-8 string
-                                path_str = value.decode("utf-8")
-                                if path_str.startswith(old_location):
-                                    new_path = new_location + path_str[len(old_location) :]
-                                    bound["value"] = new_path.encode("utf-8")
-                                    changes_made = True
-                            except (UnicodeDecodeError, AttributeError):
-                                # If it's already a string, handle it
-                                if isinstance(value, str) and value.startswith(old_location):
-                                    new_path = new_location + value[len(old_location) :]
-                                    bound["value"] = new_path.encode("utf-8")
-                                    changes_made = True
-
-            if not changes_made:
+                        # Compare the raw bytes so non-path bounds are never decoded
+                        if isinstance(value, bytes):
+                            if value.startswith(old_location_bytes):
+                                bound["value"] = new_location_bytes + value[old_location_bytes_len:]
+                                changes_made = True
+                        elif isinstance(value, str) and value.startswith(old_location):
+                            new_path = new_location + value[old_location_len:]
+                            bound["value"] = new_path.encode("utf-8")
+                            changes_made = True
+
+                return changes_made
+
+            # Decode-only pass that stops at the first record needing a rewrite, so manifests
+            # with nothing to rewrite are returned as-is without being encoded again
+            if not any(
+                rewrite_record(record) for record in fastavro.reader(io.BytesIO(manifest_content))
+            ):
                 return manifest_content
 
-            # Write the updated manifest back to bytes
+            # Stream records from a fresh reader through the writer so the manifest is never
+            # held as a list of decoded entries
+            reader = fastavro.reader(io.BytesIO(manifest_content))
+
+            def rewritten_records():
+                for record in reader:
+                    rewrite_record(record)
+                    yield record
+
             output = io.BytesIO()
-            fastavro.writer(output, schema, records)
+            # deflate is the codec Iceberg itself writes manifests with
+            fastavro.writer(output, reader.writer_schema, rewritten_records(), codec="deflate")
             return output.getvalue()
 
         except Exception as e:
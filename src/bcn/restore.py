@@ -6,15 +6,13 @@ Restores an Iceberg table from a backup to a new table location.
 """
 
 import argparse
-import json
 import os
-import re
-import shutil
 import sys
-import time
 import uuid
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
+from bcn import json_utils
 from bcn.config import Config
 from bcn.delete_file_rewriter import DeleteFileRewriter
 from bcn.iceberg_utils import ManifestFileHandler, PathAbstractor
@@ -36,6 +34,7 @@ class IcebergRestore:
         target_table: str,
         target_location: str,
         catalog: str = None,
+        spark_client: Optional[SparkClient] = None,
     ):
         """
         Initialize restore process
@@ -46,6 +45,8 @@ class IcebergRestore:
             target_table: Target table name
             target_location: Target S3 location for the table
             catalog: Catalog name (optional). Uses fallback: parameter -> env var -> default
+            spark_client: Spark client to use (optional). Defaults to the shared client
+                          for the catalog
 
         Raises:
             ValueError: If any required parameter is empty or invalid
@@ -61,10 +62,7 @@ class IcebergRestore:
             raise ValueError("Target location cannot be empty")
 
         # Check for invalid characters in backup_name and table names
-        if not re.match(r'^[a-zA-Z0-9_-]+$', backup_name):
-            raise ValueError(
-                "Backup name must contain only letters, numbers, hyphens, and underscores"
-            )
+        Config.validate_backup_name(backup_name)
 
         self.backup_name = backup_name.strip()
         self.target_database = target_database.strip()
@@ -78,9 +76,12 @@ class IcebergRestore:
             self.catalog = os.getenv("CATALOG_NAME", Config.CATALOG_NAME)
 
         self.s3_client = S3Client()
-        self.spark_client = SparkClient(app_name=f"iceberg-restore-{backup_name}", catalog=self.catalog)
-        self.work_dir = os.path.join(Config.WORK_DIR, f"restore_{backup_name}")
+        # Reuse the process-wide Spark client unless one is injected
+        self.spark_client = spark_client or SparkClient.get_or_create(self.catalog)
         self.backup_metadata = None
+        # Manifests already downloaded by _identify_delete_files, keyed by relative path.
+        # Entries are released when _restore_manifest_file consumes them.
+        self._manifest_cache = {}
 
     def restore_backup(self) -> bool:
         """
@@ -159,29 +160,21 @@ class IcebergRestore:
                 deleted_files_sizes = self._copy_deleted_files(delete_files, original_location)
                 logger.info(f"  Successfully copied and rewritten {len(deleted_files_sizes)} delete files")
 
-            restored_manifest_lists = {}
-            for relative_path in manifest_lists:
-                logger.debug(f"  Restoring manifest list: {relative_path}")
-                entries, schema = self._restore_manifest_file(relative_path)
-                if entries is not None and schema is not None:
-                    restored_manifest_lists[relative_path] = {"entries": entries, "schema": schema}
-
-            restored_individual_manifests = {}
-            for relative_path in individual_manifests:
-                logger.debug(f"  Restoring individual manifest: {relative_path}")
-                entries, schema = self._restore_manifest_file(relative_path, deleted_files_sizes)
-                if entries is not None and schema is not None:
-                    restored_individual_manifests[relative_path] = {
-                        "entries": entries,
-                        "schema": schema,
-                    }
+            # Every manifest is independent, so downloads, rewrites and uploads run concurrently
+            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                restored_manifest_lists = self._restore_manifests(executor, manifest_lists)
+                restored_individual_manifests = self._restore_manifests(
+                    executor, individual_manifests, deleted_files_sizes
+                )
 
             # Step 4: Copy data files to new location
             logger.info("Step 4: Copying data files to new location...")
             data_files = self.backup_metadata.get("data_files", [])
             logger.info(f"  Found {len(data_files)} data files to copy")
 
-            self._copy_data_files(data_files, original_location, delete_files)
+            # Older backups don't record sizes; copies then fall back to CopyObject first
+            data_file_sizes = self.backup_metadata.get("data_file_sizes")
+            self._copy_data_files(data_files, original_location, delete_files, data_file_sizes)
 
             # Step 5: Upload restored metadata to new location
             logger.info("Step 5: Uploading restored metadata to new location...")
@@ -190,11 +183,10 @@ class IcebergRestore:
             new_metadata_location = f"{self.target_location}/{metadata_path}"
 
             # Upload metadata file
-            bucket, _ = self.s3_client.parse_s3_uri(self.target_location)
-            _, key_prefix = self.s3_client.parse_s3_uri(self.target_location)
+            bucket, key_prefix = self.s3_client.parse_s3_uri(self.target_location)
             metadata_key = f"{key_prefix}/{metadata_path}"
 
-            metadata_content = json.dumps(restored_metadata, indent=2).encode("utf-8")
+            metadata_content = json_utils.dumps(restored_metadata)
             if not self.s3_client.write_object(bucket, metadata_key, metadata_content):
                 logger.error("Could not upload metadata file")
                 return False
@@ -203,45 +195,20 @@ class IcebergRestore:
             # Upload manifest files as Avro
             logger.info("Step 6: Uploading manifest files...")
 
-            # Upload manifest lists
-            for relative_path, manifest_data in restored_manifest_lists.items():
-                full_path = f"{self.target_location}/{relative_path}"
-                bucket, key = self.s3_client.parse_s3_uri(full_path)
-
-                entries = manifest_data["entries"]
-                schema = manifest_data["schema"]
-
-                try:
-                    # Write Avro with restored paths
-                    manifest_content = ManifestFileHandler.write_manifest_list(entries, schema)
-
-                    if not self.s3_client.write_object(bucket, key, manifest_content):
-                        logger.warning(f"  Could not upload manifest list {relative_path}")
-                    else:
-                        logger.debug(f"  Uploaded manifest list: {relative_path}")
-                except Exception as e:
-                    logger.warning(f"  Could not write manifest list {relative_path}: {e}")
-                    logger.error("Exception details:", exc_info=True)
-
-            # Upload individual manifests
-            for relative_path, manifest_data in restored_individual_manifests.items():
-                full_path = f"{self.target_location}/{relative_path}"
-                bucket, key = self.s3_client.parse_s3_uri(full_path)
-
-                entries = manifest_data["entries"]
-                schema = manifest_data["schema"]
-
-                try:
-                    # Write Avro with restored paths
-                    manifest_content = ManifestFileHandler.write_manifest_list(entries, schema)
-
-                    if not self.s3_client.write_object(bucket, key, manifest_content):
-                        logger.warning(f"  Could not upload individual manifest {relative_path}")
-                    else:
-                        logger.debug(f"  Uploaded individual manifest: {relative_path}")
-                except Exception as e:
-                    logger.warning(f"  Could not write individual manifest {relative_path}: {e}")
-                    logger.error("Exception details:", exc_info=True)
+            uploads = [
+                (relative_path, content, "manifest list")
+                for relative_path, content in restored_manifest_lists.items()
+            ] + [
+                (relative_path, content, "individual manifest")
+                for relative_path, content in restored_individual_manifests.items()
+            ]
+            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                uploaded = list(
+                    executor.map(lambda upload: self._upload_manifest(*upload), uploads)
+                )
+            failed = uploaded.count(False)
+            if failed:
+                logger.warning(f"  Could not upload {failed} of {len(uploads)} manifest files")
 
             # Step 7: Register table in catalog
             logger.info("Step 7: Registering table in catalog...")
@@ -255,10 +222,6 @@ class IcebergRestore:
             logger.info(f"  Table location: {self.target_location}")
             logger.info(f"  Metadata location: {new_metadata_location}")
 
-            # Cleanup
-            logger.info("Cleaning up temporary files...")
-            shutil.rmtree(self.work_dir, ignore_errors=True)
-
             return True
 
         except Exception as e:
@@ -272,7 +235,8 @@ class IcebergRestore:
         Download and parse backup metadata from the backup bucket.
 
         Retrieves the backup_metadata.json file that contains information about the backup
-        including original location, manifest lists, individual manifests, and abstracted metadata.
+        including original location, manifest lists and individual manifests, and the
+        abstracted metadata from metadata.json.
 
         Returns:
             True if metadata is successfully downloaded and parsed, False otherwise
@@ -282,16 +246,27 @@ class IcebergRestore:
         """
         try:
             # Construct backup key including any configured prefix from BACKUP_BUCKET
-            if Config.BACKUP_PREFIX:
-                backup_key = f"{Config.BACKUP_PREFIX}/{self.backup_name}/backup_metadata.json"
-            else:
-                backup_key = f"{self.backup_name}/backup_metadata.json"
-            content = self.s3_client.read_object(Config.BACKUP_BUCKET, backup_key)
+            backup_prefix = Config.get_backup_prefix(self.backup_name)
+            backup_key = f"{backup_prefix}backup_metadata.json"
+            content = self.s3_client.read_large_object(Config.BACKUP_BUCKET, backup_key)
 
             if not content:
                 return False
 
-            self.backup_metadata = json.loads(content.decode("utf-8"))
+            # Backups are stored gzip-compressed; older backups are plain JSON
+            backup_metadata = json_utils.loads_maybe_gzip(content)
+
+            # Older backups embed the abstracted metadata, newer ones only store it in
+            # metadata.json next to backup_metadata.json
+            if "abstracted_metadata" not in backup_metadata:
+                content = self.s3_client.read_large_object(
+                    Config.BACKUP_BUCKET, f"{backup_prefix}metadata.json"
+                )
+                if not content:
+                    return False
+                backup_metadata["abstracted_metadata"] = json_utils.loads(content)
+
+            self.backup_metadata = backup_metadata
             return True
 
         except Exception as e:
@@ -317,19 +292,17 @@ class IcebergRestore:
         delete_files = set()
 
         # Construct backup key prefix
-        if Config.BACKUP_PREFIX:
-            backup_prefix = f"{Config.BACKUP_PREFIX}/{self.backup_name}"
-        else:
-            backup_prefix = self.backup_name
+        backup_prefix = Config.get_backup_prefix(self.backup_name)
 
         # Read manifest lists to identify delete manifests
         delete_manifest_names = set()
         for manifest_list_path in manifest_lists:
             try:
                 # Download manifest list from backup
-                backup_key = f"{backup_prefix}/{manifest_list_path}"
+                backup_key = f"{backup_prefix}{manifest_list_path}"
                 content = self.s3_client.read_object(Config.BACKUP_BUCKET, backup_key)
                 if content:
+                    self._manifest_cache[manifest_list_path] = content
                     entries, _ = ManifestFileHandler.read_manifest_file(content)
                     for entry in entries:
                         content_type = entry.get("content", 0)
@@ -348,9 +321,10 @@ class IcebergRestore:
             if manifest_filename in delete_manifest_names:
                 try:
                     # Download the delete manifest
-                    backup_key = f"{backup_prefix}/{manifest_path}"
+                    backup_key = f"{backup_prefix}{manifest_path}"
                     content = self.s3_client.read_object(Config.BACKUP_BUCKET, backup_key)
                     if content:
+                        self._manifest_cache[manifest_path] = content
                         entries, _ = ManifestFileHandler.read_manifest_file(content)
                         for entry in entries:
                             if "data_file" in entry and "file_path" in entry["data_file"]:
@@ -367,13 +341,18 @@ class IcebergRestore:
 
         return delete_files
 
-    def _restore_manifest_file(self, relative_path: str, deleted_files_sizes: dict = {}) -> tuple:
+    def _restore_manifest_file(
+        self, relative_path: str, deleted_files_sizes: dict = {}
+    ) -> Optional[bytes]:
         """
         Download and restore paths in a manifest file.
 
-        Downloads a manifest file (in Avro format) from the backup bucket, rewrites paths
-        in the raw Avro (including bounds), then parses it and restores them to the new location.
-        Handles both manifest list files and individual manifest files with different path structures.
+        Downloads a manifest file (in Avro format) from the backup bucket and rewrites paths
+        in the raw Avro (including bounds) to the new location. Handles both manifest list
+        files and individual manifest files with different path structures.
+
+        The manifest stays encoded Avro until it is uploaded: entries are only decoded while
+        streaming through the rewriter, never held as dicts for the whole restore.
 
         Note: Deleted entries (status=2) were already filtered out during backup, so the
         manifests in backup only contain active entries.
@@ -383,44 +362,91 @@ class IcebergRestore:
             deleted_files_sizes: Dictionary mapping relative delete file paths to their sizes in bytes
 
         Returns:
-            Tuple of (entries, schema) where:
-            - entries: List of manifest entries with restored paths, or None if error
-            - schema: Avro schema of the manifest file, or None if error
+            Avro content of the manifest with restored paths, or None if error
         """
         try:
-            # Download raw Avro from backup
-            # Construct backup key including any configured prefix from BACKUP_BUCKET
-            if Config.BACKUP_PREFIX:
-                backup_key = f"{Config.BACKUP_PREFIX}/{self.backup_name}/{relative_path}"
-            else:
-                backup_key = f"{self.backup_name}/{relative_path}"
-            content = self.s3_client.read_object(Config.BACKUP_BUCKET, backup_key)
+            # Reuse the raw Avro if _identify_delete_files already downloaded it
+            content = self._manifest_cache.pop(relative_path, None)
+            if content is None:
+                # Download raw Avro from backup
+                # Construct backup key including any configured prefix from BACKUP_BUCKET
+                backup_key = f"{Config.get_backup_prefix(self.backup_name)}{relative_path}"
+                content = self.s3_client.read_object(Config.BACKUP_BUCKET, backup_key)
 
             if not content:
                 logger.warning(f"  Could not read manifest {relative_path}")
-                return None, None
+                return None
 
             # Get original location for path rewriting
             original_location = self.backup_metadata["original_location"]
 
-            # Step 1: Rewrite paths in the raw Avro (including lower_bounds/upper_bounds)
+            # Rewrite paths in the raw Avro (including lower_bounds/upper_bounds). The
+            # original bytes are returned when nothing needed rewriting
             rewritten_content = ManifestRewriter.rewrite_manifest_paths(
                 content, original_location, self.target_location, deleted_files_sizes
             )
+            if rewritten_content is None:
+                # ManifestRewriter already logged why (e.g. the file is not valid Avro)
+                logger.warning(f"  Could not rewrite paths in manifest {relative_path}")
+                return None
 
-            if rewritten_content:
-                content = rewritten_content
+            if rewritten_content is not content:
                 logger.debug(f"  Rewrote paths in manifest: {relative_path}")
-
-            # Read the Avro file to get entries and schema
-            # The paths have already been rewritten by ManifestRewriter above
-            entries, schema = ManifestFileHandler.read_manifest_file(content)
-
-            return entries, schema
+            return rewritten_content
 
         except Exception as e:
             logger.error(f"  Error restoring manifest {relative_path}: {e}", exc_info=True)
-            return None, None
+            return None
+
+    def _restore_manifests(
+        self,
+        executor: ThreadPoolExecutor,
+        relative_paths: List[str],
+        deleted_files_sizes: Optional[dict] = None,
+    ) -> dict:
+        """
+        Restore many manifest files concurrently with _restore_manifest_file.
+
+        Args:
+            executor: Executor the manifests are restored on
+            relative_paths: Relative paths of the manifest files within the backup
+            deleted_files_sizes: Dictionary mapping relative delete file paths to their sizes
+
+        Returns:
+            Dictionary mapping each successfully restored relative path to its restored Avro
+            content, in the order of relative_paths
+        """
+        deleted_files_sizes = deleted_files_sizes or {}
+        restored = executor.map(
+            lambda path: self._restore_manifest_file(path, deleted_files_sizes), relative_paths
+        )
+        return {
+            relative_path: content
+            for relative_path, content in zip(relative_paths, restored)
+            if content is not None
+        }
+
+    def _upload_manifest(self, relative_path: str, content: bytes, kind: str) -> bool:
+        """
+        Write a restored manifest file to the target location.
+
+        Args:
+            relative_path: Relative path of the manifest file within the table location
+            content: Restored Avro content of the manifest file
+            kind: Manifest kind used in log messages ("manifest list" or "individual manifest")
+
+        Returns:
+            True if the manifest was uploaded, False otherwise
+        """
+        # Only the (memoized) target location is parsed, not one URI per manifest
+        bucket, target_prefix = self.s3_client.parse_s3_uri(self.target_location)
+        key = f"{target_prefix}/{relative_path}".lstrip("/")
+
+        if not self.s3_client.write_object(bucket, key, content):
+            logger.warning(f"  Could not upload {kind} {relative_path}")
+            return False
+        logger.debug(f"  Uploaded {kind}: {relative_path}")
+        return True
 
     def _copy_deleted_files(self, delete_files: set, original_location: str) -> dict:
         """
@@ -437,10 +463,7 @@ class IcebergRestore:
             Dictionary mapping relative delete file paths to their sizes in bytes
         """
         try:
-            if Config.BACKUP_PREFIX:
-                backup_source_prefix = f"{Config.BACKUP_PREFIX}/{self.backup_name}"
-            else:
-                backup_source_prefix = self.backup_name
+            backup_source_prefix = Config.get_backup_prefix(self.backup_name)
 
             failed_files = []
             deleted_files_sizes = {}
@@ -449,7 +472,7 @@ class IcebergRestore:
 
             for relative_path in delete_files:
                 # Build source path from backup location
-                source_key = f"{backup_source_prefix}/{relative_path}"
+                source_key = f"{backup_source_prefix}{relative_path}"
                 # Build destination path at target location
                 dest_key = f"{target_prefix}/{relative_path}".lstrip("/")
                 # Delete file: download, rewrite paths, upload
@@ -490,7 +513,11 @@ class IcebergRestore:
             raise RuntimeError(f"Error copying data files: {e}") from e
 
     def _copy_data_files(
-        self, data_files: List[str], original_location: str, delete_files: set
+        self,
+        data_files: List[str],
+        original_location: str,
+        delete_files: set,
+        data_file_sizes: Optional[List[Optional[int]]] = None,
     ) -> None:
         """
         Copy data files from backup location to new target location.
@@ -502,6 +529,9 @@ class IcebergRestore:
             data_files: List of relative data file paths (from manifest files)
             original_location: Original S3 location of the table
             delete_files: Set of relative paths that are position delete files
+            data_file_sizes: File sizes aligned with data_files; large files are copied in
+                             parts ranged from these sizes instead of a HEAD request
+                             (optional)
 
         Raises:
             RuntimeError: If any data files fail to copy, includes list of up to 5 failed files
@@ -509,20 +539,19 @@ class IcebergRestore:
         try:
             # Data files are now in the backup location, not the original location
             # Construct source prefix in backup bucket
-            if Config.BACKUP_PREFIX:
-                backup_source_prefix = f"{Config.BACKUP_PREFIX}/{self.backup_name}"
-            else:
-                backup_source_prefix = self.backup_name
+            backup_source_prefix = Config.get_backup_prefix(self.backup_name)
 
             target_bucket, target_prefix = self.s3_client.parse_s3_uri(self.target_location)
 
             copied = 0
             rewritten = 0
             failed_files = []
+            progress_every = max(10, len(data_files) // 10)
+            data_file_sizes = data_file_sizes or [None] * len(data_files)
 
-            for relative_path in data_files:
+            for i, (relative_path, size) in enumerate(zip(data_files, data_file_sizes), 1):
                 # Build source path from backup location
-                source_key = f"{backup_source_prefix}/{relative_path}"
+                source_key = f"{backup_source_prefix}{relative_path}"
                 # Build destination path at target location
                 dest_key = f"{target_prefix}/{relative_path}".lstrip("/")
 
@@ -532,15 +561,15 @@ class IcebergRestore:
                 else:
                     # Regular data file: use S3 copy_object (efficient)
                     if self.s3_client.copy_object(
-                        Config.BACKUP_BUCKET, source_key, target_bucket, dest_key
+                        Config.BACKUP_BUCKET, source_key, target_bucket, dest_key, size=size
                     ):
                         copied += 1
                     else:
                         failed_files.append(relative_path)
 
-                # Progress update every 10 files
-                if (copied + rewritten) % 10 == 0:
-                    logger.debug(f"  Processed {copied + rewritten}/{len(data_files)} files...")
+                # Progress update in ~10% steps (counting skipped and failed files too)
+                if i % progress_every == 0:
+                    logger.debug(f"  Processed {i}/{len(data_files)} files...")
 
             if failed_files:
                 error_msg = f"Failed to copy {len(failed_files)} data files: {failed_files[:5]}"
@@ -2,10 +2,17 @@
 S3/MinIO client utilities for backup and restore operations
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO, Optional
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
 
 from bcn.config import Config
 from bcn.logging_config import BCNLogger
@@ -17,33 +24,148 @@ logger = BCNLogger.get_logger(__name__)
 class S3Client:
     """Client for interacting with S3/MinIO storage"""
 
+    # Payloads above this size are uploaded in parallel parts instead of a single PUT
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=50 * 1024 * 1024,
+        max_concurrency=16,
+        use_threads=True,
+    )
+
+    # Objects above this size (e.g. metadata.json of tables with long histories) are
+    # downloaded as parallel ranged GETs instead of a single stream
+    RANGED_GET_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=16 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
+    )
+
+    # Server-side copies of objects at least this large are split into parallel
+    # UploadPartCopy requests (a single CopyObject is also limited to 5 GiB)
+    MULTIPART_COPY_THRESHOLD = 64 * 1024 * 1024
+    MULTIPART_COPY_CHUNKSIZE = 64 * 1024 * 1024
+    # Part copies of all objects share one pool of this size per client
+    MULTIPART_COPY_MAX_CONCURRENCY = 8
+    # S3 limit on the number of parts in a multipart upload
+    MAX_UPLOAD_PARTS = 10000
+
     def __init__(self):
         """Initialize S3 client with configuration"""
-        self.client = boto3.client("s3", **Config.get_s3_config())
+        # Size the connection pool to the worker count plus the part copy pool so concurrent
+        # manifest, data file and part requests don't queue for a socket (botocore defaults
+        # to 10 connections)
+        client_config = BotoConfig(
+            max_pool_connections=max(Config.MAX_WORKERS, 10) + self.MULTIPART_COPY_MAX_CONCURRENCY,
+            retries={"mode": "standard"},
+            tcp_keepalive=True,
+        )
+        self.client = boto3.client("s3", config=client_config, **Config.get_s3_config())
+        # Shared by every multipart copy, so copies running on the backup and restore worker
+        # threads don't each start their own transfer threads
+        self._part_copy_executor = ThreadPoolExecutor(
+            max_workers=self.MULTIPART_COPY_MAX_CONCURRENCY, thread_name_prefix="s3-part-copy"
+        )
 
     def copy_object(
-        self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
+        self,
+        source_bucket: str,
+        source_key: str,
+        dest_bucket: str,
+        dest_key: str,
+        size: Optional[int] = None,
     ) -> bool:
         """
         Copy an object from one S3 location to another
 
+        The copy is server-side. Objects of at least MULTIPART_COPY_THRESHOLD bytes are
+        copied in parallel parts sized from the given size; when the size is unknown a single
+        CopyObject is tried first and only objects it rejects (e.g. above 5 GiB) are retried
+        in parts after a HEAD request for their size.
+
         Args:
             source_bucket: Source bucket name
             source_key: Source object key
             dest_bucket: Destination bucket name
             dest_key: Destination object key
+            size: Source object size in bytes, if known
 
         Returns:
             True if successful, False otherwise
         """
+        copy_source = {"Bucket": source_bucket, "Key": source_key}
         try:
-            copy_source = {"Bucket": source_bucket, "Key": source_key}
-            self.client.copy_object(CopySource=copy_source, Bucket=dest_bucket, Key=dest_key)
+            if size is not None and size >= self.MULTIPART_COPY_THRESHOLD:
+                # The known size sets the part ranges, so no HEAD request is sent
+                self._multipart_copy(copy_source, dest_bucket, dest_key, size)
+                return True
+            try:
+                self.client.copy_object(CopySource=copy_source, Bucket=dest_bucket, Key=dest_key)
+            except ClientError as e:
+                # CopyObject rejects sources larger than 5 GiB; retry those in parts
+                error_code = e.response.get("Error", {}).get("Code")
+                if size is not None or error_code != "InvalidRequest":
+                    raise
+                self._multipart_copy(copy_source, dest_bucket, dest_key)
             return True
         except ClientError as e:
             logger.error(f"Error copying s3://{source_bucket}/{source_key} to s3://{dest_bucket}/{dest_key}: {e}")
             return False
 
+    def _multipart_copy(
+        self, copy_source: dict, dest_bucket: str, dest_key: str, size: Optional[int] = None
+    ) -> None:
+        """
+        Copy an object server-side with parallel UploadPartCopy requests
+
+        Args:
+            copy_source: Source as {"Bucket": ..., "Key": ...}
+            dest_bucket: Destination bucket name
+            dest_key: Destination object key
+            size: Source object size in bytes; looked up with a HEAD request if not given
+        """
+        logger.debug(
+            f"Multipart copy of s3://{copy_source['Bucket']}/{copy_source['Key']} "
+            f"to s3://{dest_bucket}/{dest_key}"
+        )
+        if size is None:
+            size = self.client.head_object(**copy_source)["ContentLength"]
+        # Grow the parts for objects that would otherwise need more than MAX_UPLOAD_PARTS
+        part_size = max(self.MULTIPART_COPY_CHUNKSIZE, -(-size // self.MAX_UPLOAD_PARTS))
+
+        upload_id = self.client.create_multipart_upload(Bucket=dest_bucket, Key=dest_key)[
+            "UploadId"
+        ]
+        part_futures = [
+            self._part_copy_executor.submit(
+                self.client.upload_part_copy,
+                Bucket=dest_bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource=copy_source,
+                CopySourceRange=f"bytes={start}-{min(start + part_size, size) - 1}",
+            )
+            for part_number, start in enumerate(range(0, size, part_size), 1)
+        ]
+        try:
+            parts = [
+                {"PartNumber": part_number, "ETag": future.result()["CopyPartResult"]["ETag"]}
+                for part_number, future in enumerate(part_futures, 1)
+            ]
+            self.client.complete_multipart_upload(
+                Bucket=dest_bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            for future in part_futures:
+                future.cancel()
+            self.client.abort_multipart_upload(Bucket=dest_bucket, Key=dest_key, UploadId=upload_id)
+            raise
+
     @retry_on_error(max_attempts=3, exceptions=(ClientError,))
     def read_object(self, bucket: str, key: str) -> Optional[bytes]:
         """
@@ -72,22 +194,123 @@ class S3Client:
             )
             raise
 
-    def write_object(self, bucket: str, key: str, content: bytes) -> bool:
+    @retry_on_error(max_attempts=3, exceptions=(ClientError,))
+    def read_large_object(self, bucket: str, key: str) -> Optional[bytes]:
+        """
+        Read object content from S3 using parallel ranged GETs for large objects
+
+        Costs an extra HEAD request to learn the size, so use it for single objects that
+        may be large (metadata.json, backup_metadata.json) rather than for manifests.
+
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+
+        Returns:
+            Object content as bytes
+        """
+        output = BytesIO()
+        try:
+            self.client.download_fileobj(
+                bucket, key, output, Config=self.RANGED_GET_TRANSFER_CONFIG
+            )
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            logger.error(
+                f"S3 read failed: s3://{bucket}/{key}",
+                extra={
+                    "error_code": error_code,
+                    "bucket": bucket,
+                    "key": key,
+                    "operation": "read_large_object"
+                }
+            )
+            raise
+        return output.getvalue()
+
+    @retry_on_error(max_attempts=3, exceptions=(ClientError,))
+    def open_object_stream(self, bucket: str, key: str) -> StreamingBody:
+        """
+        Open an S3 object for streaming reads
+
+        Unlike read_object, the body is not buffered in memory; the caller reads it
+        incrementally and must close it.
+
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+
+        Returns:
+            Streaming body of the object
+        """
+        try:
+            return self.client.get_object(Bucket=bucket, Key=key)["Body"]
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            logger.error(
+                f"S3 read failed: s3://{bucket}/{key}",
+                extra={
+                    "error_code": error_code,
+                    "bucket": bucket,
+                    "key": key,
+                    "operation": "open_object_stream"
+                }
+            )
+            raise
+
+    def write_object(
+        self, bucket: str, key: str, content: bytes, content_encoding: Optional[str] = None
+    ) -> bool:
         """
         Write content to S3 object
 
+        Large payloads (e.g. backup metadata of tables with many data files) use a
+        multipart upload so parts are sent concurrently.
+
         Args:
             bucket: S3 bucket name
             key: Object key
             content: Content to write as bytes
+            content_encoding: Optional Content-Encoding of the payload (e.g. "gzip")
 
         Returns:
             True if successful, False otherwise
         """
+        extra_args = {"ContentEncoding": content_encoding} if content_encoding else {}
         try:
-            self.client.put_object(Bucket=bucket, Key=key, Body=content)
+            if len(content) > self.MULTIPART_THRESHOLD:
+                self.client.upload_fileobj(
+                    BytesIO(content),
+                    bucket,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=self.MULTIPART_TRANSFER_CONFIG,
+                )
+            else:
+                self.client.put_object(Bucket=bucket, Key=key, Body=content, **extra_args)
             return True
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error(f"Error writing to s3://{bucket}/{key}: {e}")
+            return False
+
+    def write_object_stream(self, bucket: str, key: str, stream: BinaryIO) -> bool:
+        """
+        Write a file-like object to S3 without buffering it in memory first
+
+        The stream is read in chunks and uploaded in parallel parts when it is large.
+
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            stream: Readable binary file-like object (e.g. from open_object_stream)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.client.upload_fileobj(stream, bucket, key, Config=self.MULTIPART_TRANSFER_CONFIG)
+            return True
+        except (ClientError, S3UploadFailedError) as e:
             logger.error(f"Error writing to s3://{bucket}/{key}: {e}")
             return False
 
@@ -101,15 +324,24 @@ class S3Client:
         Returns:
             Tuple of (bucket, key)
         """
-        # Normalize s3a:// and s3n:// schemes to s3://
-        normalized_uri = uri
-        if uri.startswith("s3a://") or uri.startswith("s3n://"):
-            normalized_uri = "s3://" + uri[6:]
+        return _parse_s3_uri(uri)
+
+
+@lru_cache(maxsize=65536)
+def _parse_s3_uri(uri: str) -> tuple:
+    """
+    Parse S3 URI into bucket and key (memoized, the same manifest and data file URIs
+    are parsed repeatedly during backup and restore)
+    """
+    # Normalize s3a:// and s3n:// schemes to s3://
+    normalized_uri = uri
+    if uri.startswith(("s3a://", "s3n://")):
+        normalized_uri = "s3://" + uri[6:]
 
-        if not normalized_uri.startswith("s3://"):
-            raise ValueError(f"Invalid S3 URI: {uri}")
+    if not normalized_uri.startswith("s3://"):
+        raise ValueError(f"Invalid S3 URI: {uri}")
 
-        parts = normalized_uri[5:].split("/", 1)
-        bucket = parts[0]
-        key = parts[1] if len(parts) > 1 else ""
-        return bucket, key
+    parts = normalized_uri[5:].split("/", 1)
+    bucket = parts[0]
+    key = parts[1] if len(parts) > 1 else ""
+    return bucket, key
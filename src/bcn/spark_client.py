@@ -2,6 +2,7 @@
 Spark client for Iceberg table operations
 """
 
+import threading
 from typing import Dict, List, Optional
 
 from bcn.config import Config
@@ -13,6 +14,10 @@ logger = BCNLogger.get_logger(__name__)
 class SparkClient:
     """Client for interacting with Spark and Iceberg tables"""
 
+    # Process-wide clients by catalog name, see get_or_create
+    _shared_clients: Dict[str, "SparkClient"] = {}
+    _shared_clients_lock = threading.Lock()
+
     def __init__(self, app_name: str = "bcn", catalog: str = None):
         """
         Initialize Spark client
@@ -29,6 +34,28 @@ class SparkClient:
         else:
             self.catalog_name = Config.CATALOG_NAME
 
+    @classmethod
+    def get_or_create(cls, catalog: str = None) -> "SparkClient":
+        """
+        Get the process-wide client for a catalog, creating it on first use
+
+        Backups and restores run in the same process (e.g. scripted over many tables)
+        share the client, so the Spark session is only started once.
+
+        Args:
+            catalog: Catalog name (optional). Uses: parameter -> Config.CATALOG_NAME
+
+        Returns:
+            Shared SparkClient for the catalog
+        """
+        catalog_name = catalog or Config.CATALOG_NAME
+        with cls._shared_clients_lock:
+            client = cls._shared_clients.get(catalog_name)
+            if client is None:
+                client = cls(catalog=catalog_name)
+                cls._shared_clients[catalog_name] = client
+        return client
+
     def get_spark_session(self):
         """Get or create Spark session with Iceberg configuration"""
         if self._spark is None:
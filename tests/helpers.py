@@ -0,0 +1,86 @@
+"""
+Shared fakes and Avro factories for unit tests
+"""
+
+import io
+
+import fastavro
+
+from bcn.s3_client import S3Client
+
+TABLE_LOCATION = "s3://warehouse/db/table"
+
+MANIFEST_LIST_SCHEMA = fastavro.parse_schema(
+    {
+        "type": "record",
+        "name": "manifest_file",
+        "fields": [
+            {"name": "manifest_path", "type": "string"},
+            {"name": "content", "type": "int"},
+        ],
+    }
+)
+
+MANIFEST_SCHEMA = fastavro.parse_schema(
+    {
+        "type": "record",
+        "name": "manifest_entry",
+        "fields": [
+            {"name": "status", "type": "int"},
+            {
+                "name": "data_file",
+                "type": {
+                    "type": "record",
+                    "name": "r2",
+                    "fields": [
+                        {"name": "file_path", "type": "string"},
+                        {"name": "file_size_in_bytes", "type": ["null", "long"], "default": None},
+                    ],
+                },
+            },
+        ],
+    }
+)
+
+
+def _data_file(file_path, file_size_in_bytes=None) -> dict:
+    return {"file_path": file_path, "file_size_in_bytes": file_size_in_bytes}
+
+
+def _avro(schema, records) -> bytes:
+    output = io.BytesIO()
+    fastavro.writer(output, schema, records)
+    return output.getvalue()
+
+
+class InMemoryS3Client(S3Client):
+    """S3Client backed by a dictionary, counting GET requests per object"""
+
+    def __init__(self):
+        self.objects = {}
+        self.reads = {}
+
+    def read_object(self, bucket, key):
+        self.reads[(bucket, key)] = self.reads.get((bucket, key), 0) + 1
+        return self.objects.get((bucket, key))
+
+    def read_large_object(self, bucket, key):
+        return self.read_object(bucket, key)
+
+    def open_object_stream(self, bucket, key):
+        self.reads[(bucket, key)] = self.reads.get((bucket, key), 0) + 1
+        return io.BytesIO(self.objects[(bucket, key)])
+
+    def write_object(self, bucket, key, content, content_encoding=None):
+        self.objects[(bucket, key)] = content
+        return True
+
+    def write_object_stream(self, bucket, key, stream):
+        self.objects[(bucket, key)] = stream.read()
+        return True
+
+    def copy_object(self, source_bucket, source_key, dest_bucket, dest_key, size=None):
+        if (source_bucket, source_key) not in self.objects:
+            return False
+        self.objects[(dest_bucket, dest_key)] = self.objects[(source_bucket, source_key)]
+        return True
@@ -0,0 +1,385 @@
+"""
+Unit tests for backup module
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bcn import json_utils
+from bcn.backup import IcebergBackup, _map_bounded
+from bcn.config import Config
+from bcn.iceberg_utils import PathAbstractor
+from bcn.spark_client import SparkClient
+from tests.helpers import (
+    MANIFEST_LIST_SCHEMA,
+    MANIFEST_SCHEMA,
+    TABLE_LOCATION,
+    InMemoryS3Client,
+    _avro,
+    _data_file,
+)
+
+
+@pytest.fixture
+def s3():
+    """In-memory S3 with two snapshots sharing one manifest"""
+    client = InMemoryS3Client()
+    key = "db/table/metadata"
+    client.objects[("warehouse", f"{key}/snap-1.avro")] = _avro(
+        MANIFEST_LIST_SCHEMA,
+        [{"manifest_path": f"{TABLE_LOCATION}/metadata/m1.avro", "content": 0}],
+    )
+    client.objects[("warehouse", f"{key}/snap-2.avro")] = _avro(
+        MANIFEST_LIST_SCHEMA,
+        [
+            {"manifest_path": f"{TABLE_LOCATION}/metadata/m1.avro", "content": 0},
+            {"manifest_path": f"{TABLE_LOCATION}/metadata/m2.avro", "content": 1},
+        ],
+    )
+    client.objects[("warehouse", f"{key}/m1.avro")] = _avro(
+        MANIFEST_SCHEMA,
+        [{"status": 1, "data_file": _data_file(f"{TABLE_LOCATION}/data/a.parquet", 100)}],
+    )
+    client.objects[("warehouse", f"{key}/m2.avro")] = _avro(
+        MANIFEST_SCHEMA,
+        [{"status": 1, "data_file": _data_file(f"{TABLE_LOCATION}/data/d.parquet", 200)}],
+    )
+    return client
+
+
+@pytest.fixture
+def backup(s3):
+    """IcebergBackup wired to the in-memory S3 client"""
+    backup = IcebergBackup("db", "table", "unit_backup")
+    backup.s3_client = s3
+    return backup
+
+
+class TestCollectManifestsAndData:
+    """Test the manifest traversal used by create_backup"""
+
+    def test_collects_relative_paths(self, backup):
+        """Manifest lists, manifests and data files are returned relative/full as expected"""
+        manifest_lists, manifests, data_files, data_file_sizes = (
+            backup._collect_manifests_and_data(
+                [
+                    f"{TABLE_LOCATION}/metadata/snap-1.avro",
+                    f"{TABLE_LOCATION}/metadata/snap-2.avro",
+                ],
+                TABLE_LOCATION,
+            )
+        )
+
+        assert manifest_lists == ["metadata/snap-1.avro", "metadata/snap-2.avro"]
+        assert manifests == ["metadata/m1.avro", "metadata/m2.avro"]
+        assert data_files == [
+            f"{TABLE_LOCATION}/data/a.parquet",
+            f"{TABLE_LOCATION}/data/d.parquet",
+        ]
+        assert data_file_sizes == [100, 200]
+
+    def test_data_files_are_deduplicated(self, backup, s3):
+        """A data file referenced from several manifests is returned once, with its size"""
+        s3.objects[("warehouse", "db/table/metadata/m2.avro")] = _avro(
+            MANIFEST_SCHEMA,
+            [
+                {"status": 0, "data_file": _data_file(f"{TABLE_LOCATION}/data/a.parquet", 100)},
+                {"status": 1, "data_file": _data_file(f"{TABLE_LOCATION}/data/d.parquet", 200)},
+            ],
+        )
+
+        _, _, data_files, data_file_sizes = backup._collect_manifests_and_data(
+            [f"{TABLE_LOCATION}/metadata/snap-2.avro"], TABLE_LOCATION
+        )
+
+        assert data_files == [
+            f"{TABLE_LOCATION}/data/a.parquet",
+            f"{TABLE_LOCATION}/data/d.parquet",
+        ]
+        assert data_file_sizes == [100, 200]
+
+    def test_reads_each_object_once(self, backup, s3):
+        """Each manifest list and manifest is downloaded exactly once"""
+        backup._collect_manifests_and_data(
+            [f"{TABLE_LOCATION}/metadata/snap-1.avro", f"{TABLE_LOCATION}/metadata/snap-2.avro"],
+            TABLE_LOCATION,
+        )
+
+        assert s3.reads
+        assert all(count == 1 for count in s3.reads.values()), s3.reads
+
+    def test_manifest_reads_overlap_manifest_list_reads(self, backup, s3, monkeypatch):
+        """Manifests of the first manifest list are read before the last manifest list is"""
+        m1_read = threading.Event()
+        read_object = s3.read_object
+
+        def ordered_read_object(bucket, key):
+            if key.endswith("snap-2.avro"):
+                assert m1_read.wait(timeout=5), "m1.avro was not read while snap-2.avro was"
+            content = read_object(bucket, key)
+            if key.endswith("m1.avro"):
+                m1_read.set()
+            return content
+
+        monkeypatch.setattr(s3, "read_object", ordered_read_object)
+        _, manifests, _, _ = backup._collect_manifests_and_data(
+            [f"{TABLE_LOCATION}/metadata/snap-1.avro", f"{TABLE_LOCATION}/metadata/snap-2.avro"],
+            TABLE_LOCATION,
+        )
+
+        assert manifests == ["metadata/m1.avro", "metadata/m2.avro"]
+
+    def test_trailing_slash_table_location(self, backup):
+        """A table location with a trailing slash resolves relative paths the same way"""
+        manifest_files = list(
+            backup._iter_manifest_files(
+                {"snapshots": [{"manifest-list": "metadata/snap-1.avro"}]}, f"{TABLE_LOCATION}/"
+            )
+        )
+
+        assert manifest_files == [f"{TABLE_LOCATION}/metadata/snap-1.avro"]
+
+    def test_missing_manifest_list_is_skipped(self, backup):
+        """An unreadable manifest list does not fail the traversal"""
+        manifest_lists, manifests, data_files, _ = backup._collect_manifests_and_data(
+            [f"{TABLE_LOCATION}/metadata/snap-0.avro", f"{TABLE_LOCATION}/metadata/snap-1.avro"],
+            TABLE_LOCATION,
+        )
+
+        assert manifest_lists == ["metadata/snap-0.avro", "metadata/snap-1.avro"]
+        assert manifests == ["metadata/m1.avro"]
+        assert data_files == [f"{TABLE_LOCATION}/data/a.parquet"]
+
+
+class TestUploadBackup:
+    """Test uploading a backup to the backup bucket"""
+
+    def test_manifests_are_copied(self, backup, s3, monkeypatch):
+        """Every manifest list and manifest ends up under the backup prefix"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        backup_metadata = {
+            "abstracted_metadata": {"location": ""},
+            "manifest_lists": ["metadata/snap-1.avro", "metadata/snap-2.avro"],
+            "individual_manifests": ["metadata/m1.avro", "metadata/m2.avro"],
+            "data_files": [],
+        }
+
+        assert backup._upload_backup_to_s3(backup_metadata, TABLE_LOCATION)
+
+        for relative_path in backup_metadata["manifest_lists"] + ["metadata/m1.avro"]:
+            source = s3.objects[("warehouse", f"db/table/{relative_path}")]
+            assert s3.objects[(Config.BACKUP_BUCKET, f"unit_backup/{relative_path}")] == source
+        content = s3.objects[(Config.BACKUP_BUCKET, "unit_backup/backup_metadata.json")]
+        abstracted_metadata = backup_metadata.pop("abstracted_metadata")
+        # The abstracted metadata is only stored once, in metadata.json
+        assert json_utils.loads_maybe_gzip(content) == backup_metadata
+        content = s3.objects[(Config.BACKUP_BUCKET, "unit_backup/metadata.json")]
+        assert json_utils.loads(content) == abstracted_metadata
+
+    def test_data_files_are_copied(self, backup, s3, monkeypatch):
+        """Data files are copied server-side under the backup prefix"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        s3.objects[("warehouse", "db/table/data/a.parquet")] = b"a"
+        s3.objects[("warehouse", "db/table/data/b.parquet")] = b"b"
+        backup_metadata = {
+            "abstracted_metadata": {},
+            "data_files": ["data/a.parquet", "data/b.parquet"],
+            "data_file_sizes": [1, None],
+        }
+        sizes = {}
+        copy_object = s3.copy_object
+
+        def recording_copy_object(source_bucket, source_key, dest_bucket, dest_key, size=None):
+            sizes[source_key] = size
+            return copy_object(source_bucket, source_key, dest_bucket, dest_key)
+
+        monkeypatch.setattr(s3, "copy_object", recording_copy_object)
+
+        assert backup._upload_backup_to_s3(backup_metadata, TABLE_LOCATION)
+
+        assert s3.objects[(Config.BACKUP_BUCKET, "unit_backup/data/a.parquet")] == b"a"
+        assert s3.objects[(Config.BACKUP_BUCKET, "unit_backup/data/b.parquet")] == b"b"
+        # Sizes from the manifests are handed to the copy so no HEAD request is needed
+        assert sizes == {"db/table/data/a.parquet": 1, "db/table/data/b.parquet": None}
+
+    def test_majority_of_failed_data_files_fails_backup(self, backup, s3):
+        """The backup fails when more data files fail to copy than succeed"""
+        s3.objects[("warehouse", "db/table/data/a.parquet")] = b"a"
+        backup_metadata = {
+            "abstracted_metadata": {},
+            "data_files": ["data/a.parquet", "data/missing-1.parquet", "data/missing-2.parquet"],
+        }
+
+        assert not backup._upload_backup_to_s3(backup_metadata, TABLE_LOCATION)
+
+    def test_manifest_copy_falls_back_to_download(self, backup, s3, monkeypatch):
+        """A rejected server-side copy is retried by streaming the object through"""
+        monkeypatch.setattr(s3, "copy_object", lambda *args: False)
+
+        assert backup._copy_manifest(
+            "metadata/m1.avro", "warehouse", "db/table/", "unit_backup/"
+        )
+
+        source = s3.objects[("warehouse", "db/table/metadata/m1.avro")]
+        assert s3.objects[(Config.BACKUP_BUCKET, "unit_backup/metadata/m1.avro")] == source
+        assert s3.reads[("warehouse", "db/table/metadata/m1.avro")] == 1
+
+
+class TestCollectManifestFiles:
+    """Test manifest list collection from table metadata"""
+
+    def test_only_current_ancestry_is_collected(self, backup):
+        """Manifest lists of snapshots outside the current ancestry are skipped"""
+        metadata = {
+            "location": TABLE_LOCATION,
+            "current-snapshot-id": 3,
+            "snapshots": [
+                {"snapshot-id": 1, "manifest-list": f"{TABLE_LOCATION}/metadata/snap-1.avro"},
+                {
+                    "snapshot-id": 2,
+                    "parent-snapshot-id": 1,
+                    "manifest-list": f"{TABLE_LOCATION}/metadata/snap-2.avro",
+                },
+                {
+                    "snapshot-id": 3,
+                    "parent-snapshot-id": 1,
+                    "manifest-list": f"{TABLE_LOCATION}/metadata/snap-3.avro",
+                },
+            ],
+        }
+        abstracted = PathAbstractor.abstract_metadata_file(metadata, TABLE_LOCATION)
+
+        assert list(backup._iter_manifest_files(abstracted, TABLE_LOCATION)) == [
+            f"{TABLE_LOCATION}/metadata/snap-1.avro",
+            f"{TABLE_LOCATION}/metadata/snap-3.avro",
+        ]
+
+
+class TestMapBounded:
+    """Test the bounded executor map used for manifest reads"""
+
+    def test_results_in_input_order(self):
+        """Results are yielded in input order"""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(_map_bounded(executor, lambda x: x * 2, range(10), 3)) == [
+                x * 2 for x in range(10)
+            ]
+
+    def test_items_are_pulled_lazily(self):
+        """No more than max_pending items are consumed ahead of the results"""
+        pulled = []
+
+        def items():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = _map_bounded(executor, lambda x: x, items(), 2)
+            assert next(results) == 0
+            assert len(pulled) == 3
+            assert list(results) == list(range(1, 10))
+
+
+class TestSnapshotRetention:
+    """Test optional snapshot retention filters"""
+
+    def _metadata(self):
+        return {
+            "current-snapshot-id": 3,
+            "snapshots": [
+                {"snapshot-id": 1, "timestamp-ms": 1000},
+                {"snapshot-id": 2, "parent-snapshot-id": 1, "timestamp-ms": 2000},
+                {"snapshot-id": 3, "parent-snapshot-id": 2, "timestamp-ms": 3000},
+            ],
+            "refs": {
+                "main": {"snapshot-id": 3, "type": "branch"},
+                "v1": {"snapshot-id": 1, "type": "tag"},
+            },
+        }
+
+    def test_no_retention_keeps_all(self, backup):
+        """Without options the metadata is left untouched"""
+        metadata = self._metadata()
+        backup._apply_snapshot_retention(metadata)
+        assert metadata == self._metadata()
+
+    def test_current_only(self, backup):
+        """current_only keeps only the current snapshot and its refs"""
+        backup.current_only = True
+        metadata = self._metadata()
+        backup._apply_snapshot_retention(metadata)
+        assert [s["snapshot-id"] for s in metadata["snapshots"]] == [3]
+        assert list(metadata["refs"]) == ["main"]
+
+    def test_min_snapshot_timestamp(self, backup):
+        """Snapshots older than the watermark are dropped"""
+        backup.min_snapshot_timestamp_ms = 2000
+        metadata = self._metadata()
+        backup._apply_snapshot_retention(metadata)
+        assert [s["snapshot-id"] for s in metadata["snapshots"]] == [2, 3]
+
+    def test_statistics_of_dropped_snapshots_are_pruned(self, backup):
+        """Statistics files of dropped snapshots are removed like their refs"""
+        backup.min_snapshot_timestamp_ms = 2000
+        metadata = self._metadata()
+        metadata["statistics"] = [{"snapshot-id": 1}, {"snapshot-id": 3}]
+        metadata["partition-statistics"] = [{"snapshot-id": 1}, {"snapshot-id": 2}]
+        backup._apply_snapshot_retention(metadata)
+        assert metadata["statistics"] == [{"snapshot-id": 3}]
+        assert metadata["partition-statistics"] == [{"snapshot-id": 2}]
+
+    def test_current_only_keeps_earlier_delete_manifests(self, backup):
+        """Delete manifests added by dropped snapshots are still reached from the current one"""
+        backup.current_only = True
+        metadata = {
+            "current-snapshot-id": 2,
+            "snapshots": [
+                {"snapshot-id": 1, "manifest-list": "metadata/snap-1.avro"},
+                {
+                    "snapshot-id": 2,
+                    "parent-snapshot-id": 1,
+                    "manifest-list": "metadata/snap-2.avro",
+                },
+            ],
+            "statistics": [{"snapshot-id": 1}, {"snapshot-id": 2}],
+        }
+
+        backup._apply_snapshot_retention(metadata)
+        manifest_lists, manifests, data_files, _ = backup._collect_manifests_and_data(
+            backup._iter_manifest_files(metadata, TABLE_LOCATION), TABLE_LOCATION
+        )
+
+        assert manifest_lists == ["metadata/snap-2.avro"]
+        assert manifests == ["metadata/m1.avro", "metadata/m2.avro"]
+        assert f"{TABLE_LOCATION}/data/d.parquet" in data_files
+        assert metadata["statistics"] == [{"snapshot-id": 2}]
+
+    def test_current_snapshot_always_kept(self, backup):
+        """The current snapshot survives a watermark newer than it"""
+        backup.min_snapshot_timestamp_ms = 5000
+        metadata = self._metadata()
+        backup._apply_snapshot_retention(metadata)
+        assert [s["snapshot-id"] for s in metadata["snapshots"]] == [3]
+
+
+class TestIcebergBackupInit:
+    """Test IcebergBackup input validation"""
+
+    @pytest.mark.parametrize("backup_name", ["nightly/backup", "backup\n", "back up"])
+    def test_invalid_backup_name(self, backup_name):
+        """Names that are not safe S3 key prefixes are rejected"""
+        with pytest.raises(ValueError):
+            IcebergBackup("db", "table", backup_name)
+
+    def test_spark_client_is_shared_per_catalog(self):
+        """Backups of the same catalog share one Spark client unless one is injected"""
+        first = IcebergBackup("db", "table", "first", catalog="unit_catalog")
+        second = IcebergBackup("db", "other", "second", catalog="unit_catalog")
+        assert first.spark_client is second.spark_client
+        assert first.spark_client.catalog_name == "unit_catalog"
+
+        injected = SparkClient(catalog="unit_catalog")
+        assert IcebergBackup("db", "table", "third", spark_client=injected).spark_client is injected
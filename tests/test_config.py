@@ -0,0 +1,19 @@
+"""
+Unit tests for config module
+"""
+
+from bcn.config import Config
+
+
+class TestBackupPrefix:
+    """Test backup key prefix construction"""
+
+    def test_without_configured_prefix(self, monkeypatch):
+        """Backups live at the bucket root when BACKUP_BUCKET has no prefix"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        assert Config.get_backup_prefix("nightly") == "nightly/"
+
+    def test_with_configured_prefix(self, monkeypatch):
+        """The prefix parsed from BACKUP_BUCKET is prepended"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "backups/iceberg")
+        assert Config.get_backup_prefix("nightly") == "backups/iceberg/nightly/"
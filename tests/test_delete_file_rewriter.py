@@ -0,0 +1,108 @@
+"""
+Unit tests for delete_file_rewriter module
+"""
+
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bcn.delete_file_rewriter import DeleteFileRewriter
+
+OLD_LOCATION = "s3://warehouse/db/table"
+NEW_LOCATION = "s3://warehouse/db/table_copy"
+
+# Position delete schema with the Iceberg field IDs that must survive a rewrite
+DELETE_SCHEMA = pa.schema(
+    [
+        pa.field("file_path", pa.string(), metadata={b"PARQUET:field_id": b"2147483546"}),
+        pa.field("pos", pa.int64(), metadata={b"PARQUET:field_id": b"2147483545"}),
+    ]
+)
+
+
+def _delete_file(file_paths, positions, row_group_size=None) -> bytes:
+    output = io.BytesIO()
+    table = pa.table({"file_path": file_paths, "pos": positions}, schema=DELETE_SCHEMA)
+    pq.write_table(table, output, row_group_size=row_group_size)
+    return output.getvalue()
+
+
+def _read(content: bytes) -> pa.Table:
+    return pq.read_table(io.BytesIO(content))
+
+
+class TestRewriteDeleteFilePaths:
+    """Test rewriting data file references in position delete files"""
+
+    def test_paths_under_old_location_are_moved(self):
+        """Matching paths get the new prefix, other paths and positions are kept"""
+        content = _delete_file(
+            [f"{OLD_LOCATION}/data/a.parquet", "s3://other/data/b.parquet", None],
+            [1, 2, 3],
+        )
+
+        rewritten = DeleteFileRewriter.rewrite_delete_file_paths(
+            content, OLD_LOCATION, NEW_LOCATION
+        )
+
+        table = _read(rewritten)
+        assert table.column("file_path").to_pylist() == [
+            f"{NEW_LOCATION}/data/a.parquet",
+            "s3://other/data/b.parquet",
+            None,
+        ]
+        assert table.column("pos").to_pylist() == [1, 2, 3]
+        assert table.schema.field("file_path").metadata == {b"PARQUET:field_id": b"2147483546"}
+
+    def test_row_groups_are_rewritten_in_order(self):
+        """Row groups before the first one needing a rewrite are kept, in order"""
+        content = _delete_file(
+            ["s3://other/data/b.parquet", f"{OLD_LOCATION}/data/a.parquet", "s3://other/c"],
+            [1, 2, 3],
+            row_group_size=1,
+        )
+
+        rewritten = DeleteFileRewriter.rewrite_delete_file_paths(
+            content, OLD_LOCATION, NEW_LOCATION
+        )
+
+        assert pq.ParquetFile(io.BytesIO(rewritten)).num_row_groups == 3
+        assert _read(rewritten).column("file_path").to_pylist() == [
+            "s3://other/data/b.parquet",
+            f"{NEW_LOCATION}/data/a.parquet",
+            "s3://other/c",
+        ]
+
+    def test_non_ascii_location_is_moved(self):
+        """Locations with multi-byte characters are swapped on character boundaries"""
+        old_location = "s3://warehouse/db/tablé"
+        content = _delete_file([f"{old_location}/data/a.parquet"], [1])
+
+        rewritten = DeleteFileRewriter.rewrite_delete_file_paths(
+            content, old_location, "s3://warehouse/db/tablé_copy"
+        )
+
+        assert _read(rewritten).column("file_path").to_pylist() == [
+            "s3://warehouse/db/tablé_copy/data/a.parquet"
+        ]
+
+    def test_file_without_matching_paths_is_returned_as_is(self):
+        """Delete files with no path under the old location are not re-encoded"""
+        content = _delete_file(["s3://other/data/b.parquet"], [1])
+
+        assert (
+            DeleteFileRewriter.rewrite_delete_file_paths(content, OLD_LOCATION, NEW_LOCATION)
+            is content
+        )
+
+    def test_file_without_file_path_column_is_returned_as_is(self):
+        """Parquet files that are not position deletes are not rewritten"""
+        output = io.BytesIO()
+        pq.write_table(pa.table({"pos": [1]}), output)
+        content = output.getvalue()
+
+        assert (
+            DeleteFileRewriter.rewrite_delete_file_paths(content, OLD_LOCATION, NEW_LOCATION)
+            is content
+        )
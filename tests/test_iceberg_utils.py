@@ -2,9 +2,12 @@
 Unit tests for iceberg_utils module
 """
 
+import io
+
+import fastavro
 import pytest
 
-from bcn.iceberg_utils import PathAbstractor
+from bcn.iceberg_utils import ManifestFileHandler, PathAbstractor
 
 
 class TestPathAbstractor:
@@ -226,3 +229,136 @@ class TestPathAbstractor:
         assert restored == expected, f"Expected {expected}, got {restored}"
 
         print("✓ Path restoration works correctly")
+
+    def test_abstract_paths(self):
+        """Test batch path abstraction matches abstract_path"""
+        table_location = "s3://bucket/warehouse/db/table/"
+        paths = [
+            "s3://bucket/warehouse/db/table/data/00000.parquet",
+            "s3://bucket/warehouse/db/table//data/00001.parquet",
+            "s3://bucket/warehouse/db/other/data/00002.parquet",
+            "data/00003.parquet",
+        ]
+
+        abstracted = PathAbstractor.abstract_paths(paths, table_location)
+
+        assert abstracted == [
+            "data/00000.parquet",
+            "data/00001.parquet",
+            "s3://bucket/warehouse/db/other/data/00002.parquet",
+            "data/00003.parquet",
+        ]
+        assert abstracted == [PathAbstractor.abstract_path(p, table_location) for p in paths]
+
+        print("✓ Batch path abstraction works correctly")
+
+    def test_is_s3_uri(self):
+        """Test s3:// and s3a:// paths are absolute, relative paths are not"""
+        assert PathAbstractor.is_s3_uri("s3://bucket/db/table/metadata/snap-1.avro")
+        assert PathAbstractor.is_s3_uri("s3a://bucket/db/table/metadata/snap-1.avro")
+        assert not PathAbstractor.is_s3_uri("metadata/snap-1.avro")
+
+
+def _write_avro(schema, records) -> bytes:
+    output = io.BytesIO()
+    fastavro.writer(output, fastavro.parse_schema(schema), records)
+    return output.getvalue()
+
+
+class TestManifestFileHandler:
+    """Test path extraction from Avro manifest files"""
+
+    def test_read_manifest_list_paths(self):
+        """Manifest paths are returned in file order"""
+        content = _write_avro(
+            {
+                "type": "record",
+                "name": "manifest_file",
+                "fields": [
+                    {"name": "manifest_path", "type": "string"},
+                    {"name": "added_files_count", "type": ["null", "int"]},
+                ],
+            },
+            [
+                {"manifest_path": "s3://bucket/table/metadata/m1.avro", "added_files_count": 1},
+                {"manifest_path": "s3://bucket/table/metadata/m2.avro", "added_files_count": None},
+            ],
+        )
+
+        assert ManifestFileHandler.read_manifest_list_paths(content) == [
+            "s3://bucket/table/metadata/m1.avro",
+            "s3://bucket/table/metadata/m2.avro",
+        ]
+
+    def test_read_data_files(self):
+        """Data file paths and sizes are read from the nested data_file record"""
+        content = _write_avro(
+            {
+                "type": "record",
+                "name": "manifest_entry",
+                "fields": [
+                    {"name": "status", "type": "int"},
+                    {
+                        "name": "data_file",
+                        "type": {
+                            "type": "record",
+                            "name": "r2",
+                            "fields": [
+                                {"name": "file_path", "type": "string"},
+                                {"name": "record_count", "type": "long"},
+                                {"name": "file_size_in_bytes", "type": "long"},
+                            ],
+                        },
+                    },
+                ],
+            },
+            [
+                {
+                    "status": 1,
+                    "data_file": {
+                        "file_path": "s3://bucket/a.parquet",
+                        "record_count": 3,
+                        "file_size_in_bytes": 1024,
+                    },
+                }
+            ],
+        )
+
+        assert ManifestFileHandler.read_data_files(content) == [("s3://bucket/a.parquet", 1024)]
+
+    def test_project_schema(self):
+        """Only the requested nested field is kept, with the writer's record names"""
+        writer_schema = {
+            "type": "record",
+            "name": "manifest_entry",
+            "fields": [
+                {"name": "status", "type": "int"},
+                {
+                    "name": "data_file",
+                    "type": {
+                        "type": "record",
+                        "name": "r2",
+                        "fields": [
+                            {"name": "file_path", "type": "string"},
+                            {"name": "record_count", "type": "long"},
+                        ],
+                    },
+                },
+            ],
+        }
+
+        projected = ManifestFileHandler._project_schema(
+            writer_schema, ("data_file",), ("file_path", "file_size_in_bytes")
+        )
+
+        assert projected["name"] == "manifest_entry"
+        assert [f["name"] for f in projected["fields"]] == ["data_file"]
+        assert projected["fields"][0]["type"]["name"] == "r2"
+        assert projected["fields"][0]["type"]["fields"] == [{"name": "file_path", "type": "string"}]
+        assert ManifestFileHandler._project_schema(writer_schema, (), ("manifest_path",)) is None
+        assert ManifestFileHandler._project_schema(writer_schema, ("status",), ("x",)) is None
+
+    def test_invalid_content_raises(self):
+        """Content that is not an Avro container file is rejected"""
+        with pytest.raises(ValueError):
+            ManifestFileHandler.read_data_files(b"not avro")
@@ -0,0 +1,54 @@
+"""
+Unit tests for json_utils module
+"""
+
+import json
+
+from bcn import json_utils
+
+PAYLOAD = {
+    "backup_name": "nightly",
+    "current-snapshot-id": 9223372036854775807,
+    "manifest_lists": ["metadata/snap-1.avro"],
+    "properties": {"comment": "café"},
+}
+
+
+class TestJsonUtils:
+    """Test JSON helpers with and without orjson"""
+
+    def test_dumps_is_compact(self):
+        """Output has no indentation or whitespace between tokens"""
+        content = json_utils.dumps(PAYLOAD)
+        assert isinstance(content, bytes)
+        assert b"\n" not in content
+        assert b", " not in content
+        assert json.loads(content) == PAYLOAD
+
+    def test_dumps_stdlib_fallback(self, monkeypatch):
+        """Without orjson the stdlib produces equivalent compact output"""
+        monkeypatch.setattr(json_utils, "orjson", None)
+        content = json_utils.dumps(PAYLOAD)
+        assert b"\n" not in content
+        assert json.loads(content) == PAYLOAD
+
+    def test_loads_bytes(self):
+        """Raw UTF-8 bytes are parsed without decoding first"""
+        content = json.dumps(PAYLOAD).encode("utf-8")
+        assert json_utils.loads(content) == PAYLOAD
+
+    def test_loads_stdlib_fallback(self, monkeypatch):
+        """Without orjson the stdlib parses the same bytes"""
+        monkeypatch.setattr(json_utils, "orjson", None)
+        assert json_utils.loads(json_utils.dumps(PAYLOAD)) == PAYLOAD
+
+    def test_gzip_round_trip(self):
+        """Compressed payloads are smaller and parse back to the same object"""
+        payload = {"data_files": [f"data/{i:05d}.parquet" for i in range(1000)]}
+        content = json_utils.dumps_gzip(payload)
+        assert len(content) < len(json_utils.dumps(payload)) / 4
+        assert json_utils.loads_maybe_gzip(content) == payload
+
+    def test_loads_maybe_gzip_plain(self):
+        """Uncompressed payloads (older backups) are still accepted"""
+        assert json_utils.loads_maybe_gzip(json_utils.dumps(PAYLOAD)) == PAYLOAD
@@ -0,0 +1,126 @@
+"""
+Unit tests for manifest_rewriter module
+"""
+
+import io
+
+import fastavro
+
+from bcn.manifest_rewriter import ManifestRewriter
+from tests.helpers import MANIFEST_LIST_SCHEMA, MANIFEST_SCHEMA, _avro, _data_file
+
+OLD_LOCATION = "s3://warehouse/db/table"
+NEW_LOCATION = "s3://warehouse/db/table_copy"
+
+
+BOUNDS_SCHEMA = fastavro.parse_schema(
+    {
+        "type": "record",
+        "name": "manifest_entry",
+        "fields": [
+            {
+                "name": "data_file",
+                "type": {
+                    "type": "record",
+                    "name": "r2",
+                    "fields": [
+                        {"name": "file_path", "type": "string"},
+                        {
+                            "name": "lower_bounds",
+                            "type": {
+                                "type": "array",
+                                "items": {
+                                    "type": "record",
+                                    "name": "k126_v127",
+                                    "fields": [
+                                        {"name": "key", "type": "int"},
+                                        {"name": "value", "type": "bytes"},
+                                    ],
+                                },
+                            },
+                        },
+                    ],
+                },
+            },
+        ],
+    }
+)
+
+
+def _records(content: bytes) -> list:
+    return list(fastavro.reader(io.BytesIO(content)))
+
+
+class TestRewriteManifestPaths:
+    """Test path rewriting in manifest lists and manifests"""
+
+    def test_rewrites_manifest_list_paths(self):
+        """manifest_path entries are moved to the new location"""
+        content = _avro(
+            MANIFEST_LIST_SCHEMA,
+            [{"manifest_path": f"{OLD_LOCATION}/metadata/m1.avro", "content": 0}],
+        )
+
+        rewritten = ManifestRewriter.rewrite_manifest_paths(content, OLD_LOCATION, NEW_LOCATION, {})
+
+        assert _records(rewritten) == [
+            {"manifest_path": f"{NEW_LOCATION}/metadata/m1.avro", "content": 0}
+        ]
+
+    def test_rewrites_data_file_paths_and_delete_file_sizes(self):
+        """file_path is moved and rewritten delete files get their new size"""
+        content = _avro(
+            MANIFEST_SCHEMA,
+            [
+                {"status": 1, "data_file": _data_file(f"{OLD_LOCATION}/data/a.parquet", 100)},
+                {"status": 1, "data_file": _data_file(f"{OLD_LOCATION}/data/d.parquet", 200)},
+            ],
+        )
+
+        rewritten = ManifestRewriter.rewrite_manifest_paths(
+            content, OLD_LOCATION, NEW_LOCATION, {"data/d.parquet": 250}
+        )
+
+        assert [record["data_file"] for record in _records(rewritten)] == [
+            _data_file(f"{NEW_LOCATION}/data/a.parquet", 100),
+            _data_file(f"{NEW_LOCATION}/data/d.parquet", 250),
+        ]
+
+    def test_rewrites_path_bounds_only(self):
+        """Bounds holding paths are moved, other binary bounds are kept byte for byte"""
+        content = _avro(
+            BOUNDS_SCHEMA,
+            [
+                {
+                    "data_file": {
+                        "file_path": "s3://other/data/delete.parquet",
+                        "lower_bounds": [
+                            {"key": 2147483546, "value": f"{OLD_LOCATION}/data/a.parquet".encode()},
+                            {"key": 1, "value": b"\xff\x00"},
+                        ],
+                    }
+                }
+            ],
+        )
+
+        rewritten = ManifestRewriter.rewrite_manifest_paths(content, OLD_LOCATION, NEW_LOCATION, {})
+
+        assert _records(rewritten)[0]["data_file"]["lower_bounds"] == [
+            {"key": 2147483546, "value": f"{NEW_LOCATION}/data/a.parquet".encode()},
+            {"key": 1, "value": b"\xff\x00"},
+        ]
+
+    def test_unchanged_manifest_returns_original_bytes(self, monkeypatch):
+        """Manifests without paths under the old location are returned without re-encoding"""
+        content = _avro(
+            MANIFEST_SCHEMA,
+            [{"status": 1, "data_file": _data_file("s3://other/data/a.parquet", 100)}],
+        )
+
+        def fail_writer(*args, **kwargs):
+            raise AssertionError("unchanged manifest was re-encoded")
+
+        monkeypatch.setattr(fastavro, "writer", fail_writer)
+        assert ManifestRewriter.rewrite_manifest_paths(
+            content, OLD_LOCATION, NEW_LOCATION, {}
+        ) is content
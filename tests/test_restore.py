@@ -0,0 +1,140 @@
+"""
+Unit tests for restore module
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bcn import json_utils
+from bcn.config import Config
+from bcn.iceberg_utils import ManifestFileHandler
+from bcn.restore import IcebergRestore
+from tests.helpers import (
+    MANIFEST_LIST_SCHEMA,
+    MANIFEST_SCHEMA,
+    TABLE_LOCATION,
+    InMemoryS3Client,
+    _avro,
+    _data_file,
+)
+
+
+class TestIcebergRestoreInit:
+    """Test IcebergRestore input validation"""
+
+    def test_valid_backup_name(self):
+        """Letters, numbers, hyphens and underscores are accepted"""
+        restore = IcebergRestore("nightly-backup_01", "db", "table", "s3://warehouse/db/table/")
+        assert restore.backup_name == "nightly-backup_01"
+        assert restore.target_location == "s3://warehouse/db/table"
+
+    @pytest.mark.parametrize("backup_name", ["nightly/backup", "backup\n", "back up"])
+    def test_invalid_backup_name(self, backup_name):
+        """Names that are not safe S3 key prefixes are rejected"""
+        with pytest.raises(ValueError):
+            IcebergRestore(backup_name, "db", "table", "s3://warehouse/db/table")
+
+
+class TestManifestReads:
+    """Test that restore downloads each backed up manifest once"""
+
+    def test_delete_manifests_are_read_once(self, monkeypatch):
+        """Manifests read while identifying delete files are reused when restoring"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        s3 = InMemoryS3Client()
+        s3.objects[(Config.BACKUP_BUCKET, "unit_backup/metadata/snap-1.avro")] = _avro(
+            MANIFEST_LIST_SCHEMA,
+            [{"manifest_path": f"{TABLE_LOCATION}/metadata/m2.avro", "content": 1}],
+        )
+        s3.objects[(Config.BACKUP_BUCKET, "unit_backup/metadata/m2.avro")] = _avro(
+            MANIFEST_SCHEMA,
+            [{"status": 1, "data_file": {"file_path": f"{TABLE_LOCATION}/data/d.parquet"}}],
+        )
+        restore = IcebergRestore("unit_backup", "db", "restored", "s3://warehouse/db/restored")
+        restore.s3_client = s3
+        restore.backup_metadata = {"original_location": TABLE_LOCATION}
+
+        delete_files = restore._identify_delete_files(
+            ["metadata/snap-1.avro"], ["metadata/m2.avro"]
+        )
+        for relative_path in ["metadata/snap-1.avro", "metadata/m2.avro"]:
+            assert restore._restore_manifest_file(relative_path) is not None
+
+        assert delete_files == {"data/d.parquet"}
+        assert all(count == 1 for count in s3.reads.values()), s3.reads
+        assert not restore._manifest_cache
+
+
+class TestRestoreManifests:
+    """Test concurrent restore and upload of manifest files"""
+
+    def test_manifests_are_restored_and_uploaded(self, monkeypatch):
+        """Restored manifests keep their order and land under the target location"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        s3 = InMemoryS3Client()
+        for name in ["m1", "m2"]:
+            s3.objects[(Config.BACKUP_BUCKET, f"unit_backup/metadata/{name}.avro")] = _avro(
+                MANIFEST_SCHEMA,
+                [{"status": 1, "data_file": _data_file(f"{TABLE_LOCATION}/data/{name}.parquet")}],
+            )
+        restore = IcebergRestore("unit_backup", "db", "restored", "s3://warehouse/db/restored")
+        restore.s3_client = s3
+        restore.backup_metadata = {"original_location": TABLE_LOCATION}
+
+        relative_paths = ["metadata/m1.avro", "metadata/missing.avro", "metadata/m2.avro"]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            restored = restore._restore_manifests(executor, relative_paths)
+
+        assert list(restored) == ["metadata/m1.avro", "metadata/m2.avro"]
+
+        for relative_path, content in restored.items():
+            assert restore._upload_manifest(relative_path, content, "individual manifest")
+        uploaded = s3.objects[("warehouse", "db/restored/metadata/m2.avro")]
+        entries, _ = ManifestFileHandler.read_manifest_file(uploaded)
+        assert entries[0]["data_file"]["file_path"] == "s3://warehouse/db/restored/data/m2.parquet"
+        assert ("warehouse", "db/restored/metadata/m1.avro") in s3.objects
+
+
+class TestDownloadBackupMetadata:
+    """Test reading backup metadata written by current and older backups"""
+
+    @pytest.fixture
+    def restore(self, monkeypatch):
+        """IcebergRestore wired to an empty in-memory S3 client"""
+        monkeypatch.setattr(Config, "BACKUP_PREFIX", "")
+        restore = IcebergRestore("unit_backup", "db", "restored", "s3://warehouse/db/restored")
+        restore.s3_client = InMemoryS3Client()
+        return restore
+
+    def test_abstracted_metadata_is_read_from_metadata_json(self, restore):
+        """Abstracted metadata not embedded in backup_metadata.json comes from metadata.json"""
+        objects = restore.s3_client.objects
+        objects[(Config.BACKUP_BUCKET, "unit_backup/backup_metadata.json")] = (
+            json_utils.dumps_gzip({"original_location": TABLE_LOCATION})
+        )
+        objects[(Config.BACKUP_BUCKET, "unit_backup/metadata.json")] = json_utils.dumps(
+            {"format-version": 2}
+        )
+
+        assert restore._download_backup_metadata()
+        assert restore.backup_metadata == {
+            "original_location": TABLE_LOCATION,
+            "abstracted_metadata": {"format-version": 2},
+        }
+
+    def test_embedded_abstracted_metadata_is_used(self, restore):
+        """Older backups embed the abstracted metadata and need no second read"""
+        backup_metadata = {
+            "original_location": TABLE_LOCATION,
+            "abstracted_metadata": {"format-version": 2},
+        }
+        restore.s3_client.objects[(Config.BACKUP_BUCKET, "unit_backup/backup_metadata.json")] = (
+            json_utils.dumps(backup_metadata)
+        )
+
+        assert restore._download_backup_metadata()
+        assert restore.backup_metadata == backup_metadata
+        assert list(restore.s3_client.reads) == [
+            (Config.BACKUP_BUCKET, "unit_backup/backup_metadata.json")
+        ]
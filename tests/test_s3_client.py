@@ -0,0 +1,206 @@
+"""
+Unit tests for s3_client module
+"""
+
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bcn.config import Config
+from bcn.s3_client import S3Client
+
+
+class TestParseS3Uri:
+    """Test S3 URI parsing"""
+
+    def setup_method(self):
+        """Create a client (no requests are made)"""
+        self.client = S3Client()
+
+    def test_parse_s3_uri(self):
+        """Bucket and key are split on the first slash"""
+        assert self.client.parse_s3_uri("s3://bucket/db/table/data/a.parquet") == (
+            "bucket",
+            "db/table/data/a.parquet",
+        )
+
+    def test_parse_s3a_uri(self):
+        """s3a:// and s3n:// URIs are normalized to s3://"""
+        assert self.client.parse_s3_uri("s3a://bucket/key") == ("bucket", "key")
+        assert self.client.parse_s3_uri("s3n://bucket/key") == ("bucket", "key")
+
+    def test_parse_bucket_only(self):
+        """A URI without key returns an empty key"""
+        assert self.client.parse_s3_uri("s3://bucket") == ("bucket", "")
+
+    def test_parse_invalid_uri(self):
+        """Non-S3 URIs are rejected every time, not only on the first call"""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self.client.parse_s3_uri("hdfs://bucket/key")
+
+
+class TestS3ClientConfig:
+    """Test boto3 client configuration"""
+
+    def test_connection_pool_matches_workers(self, monkeypatch):
+        """The HTTP connection pool covers the worker pool and the shared part copy pool"""
+        monkeypatch.setattr(Config, "MAX_WORKERS", 64)
+        client = S3Client()
+        assert (
+            client.client.meta.config.max_pool_connections
+            == 64 + S3Client.MULTIPART_COPY_MAX_CONCURRENCY
+        )
+
+
+class TestWriteObject:
+    """Test single-part vs multipart uploads"""
+
+    def setup_method(self):
+        """Record which boto3 upload API is used"""
+        self.client = S3Client()
+        self.calls = []
+        self.client.client.put_object = lambda **kwargs: self.calls.append("put_object")
+        self.client.client.upload_fileobj = lambda *args, **kwargs: self.calls.append(
+            "upload_fileobj"
+        )
+
+    def test_small_payload_uses_put_object(self):
+        """Small payloads are written with a single PUT"""
+        assert self.client.write_object("bucket", "key", b"{}")
+        assert self.calls == ["put_object"]
+
+    def test_large_payload_uses_multipart(self):
+        """Payloads above the threshold use a multipart upload"""
+        content = b"x" * (S3Client.MULTIPART_THRESHOLD + 1)
+        assert self.client.write_object("bucket", "key", content)
+        assert self.calls == ["upload_fileobj"]
+
+    def test_stream_is_uploaded_without_buffering(self):
+        """Streams are handed to the managed upload as-is"""
+        uploaded = []
+        self.client.client.upload_fileobj = lambda fileobj, *args, **kwargs: uploaded.append(
+            fileobj
+        )
+        stream = io.BytesIO(b"avro")
+        assert self.client.write_object_stream("bucket", "key", stream)
+        assert uploaded == [stream]
+
+
+class TestReadLargeObject:
+    """Test ranged downloads of large objects"""
+
+    def test_returns_downloaded_bytes(self):
+        """The managed download is collected into a single bytes object"""
+        client = S3Client()
+        calls = []
+
+        def download_fileobj(bucket, key, fileobj, **kwargs):
+            calls.append(kwargs.get("Config"))
+            fileobj.write(b"part-1")
+            fileobj.write(b"part-2")
+
+        client.client.download_fileobj = download_fileobj
+        assert client.read_large_object("bucket", "metadata.json") == b"part-1part-2"
+        assert calls == [S3Client.RANGED_GET_TRANSFER_CONFIG]
+
+
+class TestCopyObject:
+    """Test single-request vs multipart server-side copies"""
+
+    def setup_method(self):
+        """Record which boto3 copy APIs are used"""
+        self.client = S3Client()
+        self.calls = []
+        self.client.client.copy_object = lambda **kwargs: self.calls.append("copy_object")
+        self.client.client.head_object = self._recorder(
+            "head_object", {"ContentLength": 3 * S3Client.MULTIPART_COPY_CHUNKSIZE}
+        )
+        self.client.client.create_multipart_upload = self._recorder(
+            "create_multipart_upload", {"UploadId": "upload"}
+        )
+        self.client.client.upload_part_copy = self._recorder(
+            "upload_part_copy", {"CopyPartResult": {"ETag": "etag"}}
+        )
+        self.client.client.complete_multipart_upload = self._recorder(
+            "complete_multipart_upload", {}
+        )
+        self.client.client.abort_multipart_upload = self._recorder("abort_multipart_upload", {})
+
+    def _recorder(self, name, response):
+        def record(**kwargs):
+            self.calls.append(name)
+            return response
+
+        return record
+
+    def test_small_object_uses_copy_object(self):
+        """Objects below the threshold are copied with a single request"""
+        assert self.client.copy_object("src", "key", "dst", "key", size=1024)
+        assert self.calls == ["copy_object"]
+
+    def test_large_object_uses_multipart_copy(self):
+        """Objects above the threshold are copied in parts"""
+        size = 3 * S3Client.MULTIPART_COPY_CHUNKSIZE
+        assert self.client.copy_object("src", "key", "dst", "key", size=size)
+        assert self.calls.count("upload_part_copy") == 3
+        assert self.calls[-1] == "complete_multipart_upload"
+
+    def test_known_size_skips_head_request(self):
+        """A size given by the caller is used for the part ranges instead of a HEAD request"""
+        size = S3Client.MULTIPART_COPY_THRESHOLD
+        assert self.client.copy_object("src", "key", "dst", "key", size=size)
+        assert "head_object" not in self.calls
+
+    def test_part_ranges_cover_the_object(self):
+        """Parts are contiguous byte ranges ending at the last byte of the source"""
+        ranges = []
+
+        def upload_part_copy(**kwargs):
+            ranges.append(kwargs["CopySourceRange"])
+            return {"CopyPartResult": {"ETag": "etag"}}
+
+        self.client.client.upload_part_copy = upload_part_copy
+        chunk = S3Client.MULTIPART_COPY_CHUNKSIZE
+        self.client._multipart_copy({"Bucket": "src", "Key": "key"}, "dst", "key", 2 * chunk + 1)
+
+        assert ranges == [
+            f"bytes=0-{chunk - 1}",
+            f"bytes={chunk}-{2 * chunk - 1}",
+            f"bytes={2 * chunk}-{2 * chunk}",
+        ]
+
+    def test_failed_part_aborts_the_upload(self):
+        """A failed part copy aborts the multipart upload and fails the copy"""
+
+        def upload_part_copy(**kwargs):
+            raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPartCopy")
+
+        self.client.client.upload_part_copy = upload_part_copy
+        size = S3Client.MULTIPART_COPY_THRESHOLD
+        assert not self.client.copy_object("src", "key", "dst", "key", size=size)
+        assert self.calls[-1] == "abort_multipart_upload"
+        assert "complete_multipart_upload" not in self.calls
+
+    def test_rejected_copy_of_unknown_size_is_retried_in_parts(self):
+        """A CopyObject rejected as too large is retried as a multipart copy"""
+
+        def copy_object(**kwargs):
+            self.calls.append("copy_object")
+            raise ClientError({"Error": {"Code": "InvalidRequest"}}, "CopyObject")
+
+        self.client.client.copy_object = copy_object
+        assert self.client.copy_object("src", "key", "dst", "key")
+        assert self.calls[:3] == ["copy_object", "head_object", "create_multipart_upload"]
+        assert self.calls[-1] == "complete_multipart_upload"
+
+    def test_missing_source_fails(self):
+        """Other copy errors are reported as a failed copy"""
+
+        def copy_object(**kwargs):
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "CopyObject")
+
+        self.client.client.copy_object = copy_object
+        assert not self.client.copy_object("src", "key", "dst", "key")
+        assert self.calls == []